@@ -11,14 +11,20 @@ import torch
 import torch.nn as nn
 import numpy as np
 import re
+import hashlib
+import itertools
+import json
 from model import build_transformer
 from config import get_config
+from decoding import greedy_decode, decode_batch
+import metrics
 
-from torch.utils.data import Dataset, DataLoader, random_split
+from torch.utils.data import Dataset, DataLoader, Sampler, random_split
 from torch.optim.lr_scheduler import LambdaLR
 from torch.optim import AdamW
 from tqdm import tqdm
 import os
+import time
 from pathlib import Path
 import csv
 
@@ -227,15 +233,17 @@ cpp_size=len(cpp_vocabulary)
 rust_size=len(rust_vocabulary)
 config = get_config()
 
-class CppTokenizer:
-    def __init__(self, vocab,config):
-        self.vocab = vocab
-        self.token_to_id = {token: idx for idx, token in enumerate(vocab)}
-        self.id_to_token = {idx: token for token, idx in self.token_to_id.items()}
-
-    def convert_tokens_to_ids(self, code, variables, constants, strings, pred=False):
-        # Your token specification remains the same.
-        token_specification = [
+def build_id_to_token(vocab, surface_vocab=None):
+    # List indexed by token id, so turning an id back into a token is one index instead of a scan over the vocabulary
+    # surface_vocab holds the printable form of the same tokens (e.g. 'let ' for 'let'), matched on the stripped token
+    surface = {token.strip(): token for token in surface_vocab} if surface_vocab else {}
+    id_to_token = [None] * (max(vocab.values()) + 1)
+    for token, idx in vocab.items():
+        id_to_token[idx] = surface.get(token, token)
+    return id_to_token
+
+# Token specifications, compiled once at import so the tokenizers don't rebuild them for every line
+CPP_TOKEN_SPECIFICATION = [
     ('NEWLINE', r'\n'),
     ('WHITESPACE', r'\s+'),
     ('FIRST', r'\+\+|--|<=|>=|==|!=|\+=|-=|\*=|\/=|%=|&=|\|=|\^='),
@@ -247,40 +255,75 @@ class CppTokenizer:
     ('WORD', r'\b[a-zA-Z_][a-zA-Z_0-9]*\b'),  # Words (identifiers)
     ('OPERATOR', r'[+\-*/%&|^!=<>]=?|!=|==|\+\+|--|\|\||&&|<<|>>|[?:]'),
     ('PUNCTUATION', r'[()\[\]{};:.,]'),
-        ]
-
-        tokens = []
-        tokens_preditct=[]
-        token_re = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in token_specification)
-        for match in re.finditer(token_re, code, re.DOTALL | re.MULTILINE):
-            kind = match.lastgroup
-            value = match.group(kind)
-            if (kind in ['NEWLINE', 'WHITESPACE']):
-                continue
-            elif (value not in self.vocab) and (kind == 'WORD'):
-                tokens.append(self.vocab.get('<var>'))
-                variables.append(value)
-                tokens_preditct.append(value)
-            elif (value not in self.vocab) and (kind == 'NUMBER'):
-                tokens.append(self.vocab.get('<num>'))
-                constants.append(value)
-                tokens_preditct.append(value)
-            elif (value not in self.vocab) and (kind in ['STRING', 'CHAR']):
-                tokens.append(self.vocab.get('<str>'))
-                strings.append(value)
-                tokens_preditct.append(value)
-            elif (value in self.vocab):
-                tokens.append(self.vocab.get(value))
-                tokens_preditct.append(value)
+]
+CPP_TOKEN_RE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in CPP_TOKEN_SPECIFICATION), re.DOTALL | re.MULTILINE)
+
+RUST_TOKEN_SPECIFICATION = [
+    ('FIRST', r'\+\+|--|<=|>=|==|!=|\+=|-=|\*=|\/=|%=|&=|\|=|\^='),  # High priority operators
+    ('SECOND', r'&&|\|\||!|<<|>>'),  # Logical operators
+    ('COMMENT', r'//.*?$|/\*.*?\*/'),  # Comments
+    ('STRING', r'"(?:\\.|[^\\"])*"'),  # Double-quoted strings
+    ('CHAR', r"'(?:\\.|[^\\'])'"),     # Single-quoted characters
+    ('NUMBER', r'\b\d+(\.\d*)?([eE][+-]?\d+)?\b'),  # Numbers
+    ('WORD', r'\b[a-zA-Z_!][a-zA-Z_0-9]*\b'),  # Identifiers (variables)
+    ('OPERATOR', r'[+\-*/%&|^!=<>]=?|!=|==|\+\+|--|\|\||&&|<<|>>|[?:]'),  # Operators
+    ('PUNCTUATION', r'[()\[\]{};:.,]'),  # Punctuation
+    ('WHITESPACE', r'\s+'),  # Whitespace
+    ('NEWLINE', r'\n'),  # Newlines
+]
+RUST_TOKEN_RE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in RUST_TOKEN_SPECIFICATION), re.DOTALL | re.MULTILINE)
+
+def scan_tokens(token_re, vocab, code):
+    # One pass over the code: returns the token ids, the surface tokens that got an id,
+    # and the identifiers, numbers and strings that were replaced by <var>, <num> and <str>
+    var_id, num_id, str_id = vocab.get('<var>'), vocab.get('<num>'), vocab.get('<str>')
+    tokens, surface, variables, constants, strings = [], [], [], [], []
+    for match in token_re.finditer(code):
+        kind = match.lastgroup
+        if kind == 'NEWLINE' or kind == 'WHITESPACE':
+            continue
+        value = match.group(kind)
+        token_id = vocab.get(value)
+        if token_id is not None:
+            tokens.append(token_id)
+            surface.append(value)
+        elif kind == 'WORD':
+            tokens.append(var_id)
+            variables.append(value)
+            surface.append(value)
+        elif kind == 'NUMBER':
+            tokens.append(num_id)
+            constants.append(value)
+            surface.append(value)
+        elif kind == 'STRING' or kind == 'CHAR':
+            tokens.append(str_id)
+            strings.append(value)
+            surface.append(value)
+    return tokens, surface, variables, constants, strings
+
+class CppTokenizer:
+    def __init__(self, vocab,config):
+        self.vocab = vocab
+        self.token_to_id = {token: idx for idx, token in enumerate(vocab)}
+        self.id_to_token = build_id_to_token(vocab)
+
+    def scan(self, code):
+        # Returns (ids, surface tokens, variables, constants, strings) for code
+        return scan_tokens(CPP_TOKEN_RE, self.vocab, code)
+
+    def convert_tokens_to_ids(self, code, variables, constants, strings, pred=False):
+        tokens, tokens_preditct, line_variables, line_constants, line_strings = self.scan(code)
+        variables.extend(line_variables)
+        constants.extend(line_constants)
+        strings.extend(line_strings)
         if(pred==True):
           return tokens_preditct
         else:
           return tokens
 
-    def __call__(self, text, padding='max_length', truncation=True, max_length=config['seq_len'], return_tensors=None, variables=[], constants=[], strings=[]):
-        token_ids = self.convert_tokens_to_ids(text, variables, constants, strings)
-        token_ids.insert(0, self.vocab.get('[SOS]'))
-        token_ids.append(self.vocab.get('[EOS]'))
+    def pad_ids(self, token_ids, padding='max_length', truncation=True, max_length=config['seq_len']):
+        # Adds [SOS]/[EOS] and padding around ids that were already scanned
+        token_ids = [self.vocab.get('[SOS]')] + token_ids + [self.vocab.get('[EOS]')]
 
         if truncation and max_length:
             token_ids = token_ids[:max_length]
@@ -291,66 +334,83 @@ class CppTokenizer:
 
         if truncation and max_length:
             token_ids = token_ids[:max_length]
-        encoder_input=torch.tensor(token_ids)
+        return token_ids
+
+    def pad_inputs(self, token_ids, padding='max_length', truncation=True, max_length=config['seq_len'], return_tensors=None):
+        encoder_input=torch.tensor(self.pad_ids(token_ids, padding, truncation, max_length))
         if return_tensors == "pt":
             return {
                 "input_ids": encoder_input,
                 "attention_mask": (encoder_input != self.vocab.get('[PAD]')).unsqueeze(0).unsqueeze(0).int(),
             }
 
+    def __call__(self, text, padding='max_length', truncation=True, max_length=config['seq_len'], return_tensors=None, variables=None, constants=None, strings=None):
+        token_ids = self.convert_tokens_to_ids(text, [] if variables is None else variables, [] if constants is None else constants, [] if strings is None else strings)
+        return self.pad_inputs(token_ids, padding, truncation, max_length, return_tensors)
+
 import re
 import torch
 
 class RustTokenizer:
-    def __init__(self, vocab, config):
+    def __init__(self, vocab, config, surface_vocab=None):
         self.vocab = vocab
         self.token_to_id = {token: idx for idx, token in enumerate(vocab)}
-        self.id_to_token = {idx: token for token, idx in self.token_to_id.items()}
+        # The model is trained on the ids of vocab, surface_vocab only decides how each token is printed
+        self.id_to_token = build_id_to_token(vocab, surface_vocab)
+        self.pad_id = vocab.get('[PAD]')
+        # Markers around a decoded line, dropped by id (a line cut at its length limit has no [EOS])
+        self.skipped_ids = frozenset((self.pad_id, vocab.get('[SOS]'), vocab.get('[EOS]')))
+        self.placeholder_ids = (vocab.get('<var>'), vocab.get('<num>'), vocab.get('<str>'))
+        self._causal_masks = {} # size --> mask, built once and shared (callers only combine it into new tensors)
+
+    def scan(self, code):
+        # Returns (ids, surface tokens, variables, constants, strings) for code
+        return scan_tokens(RUST_TOKEN_RE, self.vocab, code)
 
     def convert_tokens_to_ids(self, code, variables, constants, strings):
-        # Updated token specification with expression recognizer at the top
-        token_specification = [
-            ('FIRST', r'\+\+|--|<=|>=|==|!=|\+=|-=|\*=|\/=|%=|&=|\|=|\^='),  # High priority operators
-            ('SECOND', r'&&|\|\||!|<<|>>'),  # Logical operators
-            ('COMMENT', r'//.*?$|/\*.*?\*/'),  # Comments
-            ('STRING', r'"(?:\\.|[^\\"])*"'),  # Double-quoted strings
-            ('CHAR', r"'(?:\\.|[^\\'])'"),     # Single-quoted characters
-            ('NUMBER', r'\b\d+(\.\d*)?([eE][+-]?\d+)?\b'),  # Numbers
-            ('WORD', r'\b[a-zA-Z_!][a-zA-Z_0-9]*\b'),  # Identifiers (variables)
-            ('OPERATOR', r'[+\-*/%&|^!=<>]=?|!=|==|\+\+|--|\|\||&&|<<|>>|[?:]'),  # Operators
-            ('PUNCTUATION', r'[()\[\]{};:.,]'),  # Punctuation
-            ('WHITESPACE', r'\s+'),  # Whitespace
-            ('NEWLINE', r'\n'),  # Newlines
-        ]
-
-        tokens = []
-        token_re = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in token_specification)
-
-        for match in re.finditer(token_re, code, re.DOTALL | re.MULTILINE):
-            kind = match.lastgroup
-            value = match.group(kind)
-            if kind in ['NEWLINE', 'WHITESPACE']:
-                continue  # Skip whitespace and newlines
-            elif (value not in self.vocab) and (kind == 'WORD'):
-                tokens.append(self.vocab.get('<var>'))
-                variables.append(value)
-            elif (value not in self.vocab) and (kind == 'NUMBER'):
-                tokens.append(self.vocab.get('<num>'))
-                constants.append(value)
-            elif (value not in self.vocab) and (kind in ['STRING', 'CHAR']):
-                tokens.append(self.vocab.get('<str>'))
-                strings.append(value)
-            elif value in self.vocab:
-                tokens.append(self.vocab.get(value))
-
+        tokens, _, line_variables, line_constants, line_strings = self.scan(code)
+        variables.extend(line_variables)
+        constants.extend(line_constants)
+        strings.extend(line_strings)
         return tokens
 
     def causal_mask(self, size):
-        mask = torch.triu(torch.ones((1, size, size)), diagonal=1).type(torch.int)
-        return mask == 0
+        mask = self._causal_masks.get(size)
+        if mask is None:
+            mask = torch.triu(torch.ones((1, size, size)), diagonal=1).type(torch.int) == 0
+            self._causal_masks[size] = mask
+        return mask
+
+    def detokenize(self, ids, variables, constants, strings):
+        # Turns decoded ids back into text pieces, filling <var>/<num>/<str> with the line's own values in order
+        # A placeholder with no value left, [PAD], [SOS], [EOS] and unknown ids produce nothing
+        id_to_token = self.id_to_token
+        values = dict(zip(self.placeholder_ids, (iter(variables), iter(constants), iter(strings))))
+        pieces = []
+        for i in ids:
+            if i in self.skipped_ids:
+                continue
+            source = values.get(i)
+            piece = next(source, None) if source is not None else (id_to_token[i] if 0 <= i < len(id_to_token) else None)
+            if piece is not None:
+                pieces.append(piece)
+        return pieces
+
+    def __call__(self, text, padding='max_length', truncation=True, max_length=None, return_tensors=None, variables=None, constants=None, strings=None):
+        token_ids = self.convert_tokens_to_ids(text, [] if variables is None else variables, [] if constants is None else constants, [] if strings is None else strings)
+        token_dec, labels = self.pad_targets(token_ids, padding, truncation, max_length)
+        decoder_input = torch.tensor(token_dec)
+        labels = torch.tensor(labels)
 
-    def __call__(self, text, padding='max_length', truncation=True, max_length=None, return_tensors=None, variables=[], constants=[], strings=[]):
-        token_ids = self.convert_tokens_to_ids(text, variables, constants, strings)
+        if return_tensors == "pt":
+            return {
+                "input_ids": decoder_input,
+                "attention_mask": (decoder_input != self.vocab.get('[PAD]')).unsqueeze(0).int() & self.causal_mask((decoder_input.size(0))),  # (1, seq_len) & (1, seq_len, seq_len),
+                "labels": labels
+            }
+
+    def pad_targets(self, token_ids, padding='max_length', truncation=True, max_length=None):
+        # Decoder input ([SOS] + ids) and labels (ids + [EOS]) for ids that were already scanned
         labels = list(token_ids)
         token_dec = list(token_ids)
         token_dec.insert(0, self.vocab.get('[SOS]'))  # SOS token
@@ -369,94 +429,149 @@ class RustTokenizer:
         if truncation and max_length:
             token_dec = token_dec[:max_length]
             labels = labels[:max_length]
-
-        decoder_input = torch.tensor(token_dec)
-        labels = torch.tensor(labels)
-
-        if return_tensors == "pt":
-            return {
-                "input_ids": decoder_input,
-                "attention_mask": (decoder_input != self.vocab.get('[PAD]')).unsqueeze(0).int() & self.causal_mask((decoder_input.size(0))),  # (1, seq_len) & (1, seq_len, seq_len),
-                "labels": labels
-            }
+        return token_dec, labels
+
+def corpus_tag(cpp_code, rust_code, cpp_tokenizer, rust_tokenizer, max_length):
+    # Changes with the corpus, the vocabularies or the sequence length, so a stale token file is rebuilt
+    digest = hashlib.sha256(f"{max_length}:{len(cpp_code)}:{len(rust_code)}".encode('utf-8'))
+    for vocab in (cpp_tokenizer.vocab, rust_tokenizer.vocab):
+        digest.update(json.dumps(vocab, sort_keys=True).encode('utf-8'))
+    for text in itertools.chain(cpp_code, rust_code):
+        digest.update(text.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def pretokenize(cpp_code, rust_code, cpp_tokenizer, rust_tokenizer, max_length, out=None):
+    # (samples, 3, max_length) int16: encoder input, decoder input and labels of every pair
+    out = np.empty((len(cpp_code), 3, max_length), dtype=np.int16) if out is None else out
+    for i, (cpp_text, rust_text) in enumerate(zip(cpp_code, rust_code)):
+        out[i, 0] = cpp_tokenizer.pad_ids(cpp_tokenizer.scan(cpp_text)[0], max_length=max_length)
+        out[i, 1], out[i, 2] = rust_tokenizer.pad_targets(rust_tokenizer.scan(rust_text)[0], max_length=max_length)
+    return out
 
 class CodeDataset(Dataset):
-    def __init__(self, cpp_code, rust_code, cpp_tokenizer,rust_tokenizer, max_length):
+    # The corpus is tokenized once, not on every fetch of every epoch. With cache_path the token array is
+    # written to that .npy file and memory mapped from it, and later runs on the same corpus skip tokenizing.
+    # Batch it with collate_fn=dataset.collate, which adds the padding and causal masks
+    # (and with batch_sampler=BucketBatchSampler(dataset.lengths(), ...) for batches of similar lengths)
+    def __init__(self, cpp_code, rust_code, cpp_tokenizer,rust_tokenizer, max_length, cache_path=None, dynamic_padding=True):
         self.cpp_code = cpp_code
         self.rust_code = rust_code
         self.cpp_tokenizer = cpp_tokenizer
         self.rust_tokenizer = rust_tokenizer
         self.max_length = max_length
+        self.cache_path = cache_path
+        self.dynamic_padding = dynamic_padding # collate pads each batch to its longest sample instead of max_length
+        self._tokens = None
+        if cache_path is None:
+            self._tokens = pretokenize(cpp_code, rust_code, cpp_tokenizer, rust_tokenizer, max_length)
+        else:
+            self._build_cache()
+
+    def _build_cache(self):
+        tag = corpus_tag(self.cpp_code, self.rust_code, self.cpp_tokenizer, self.rust_tokenizer, self.max_length)
+        tag_path = self.cache_path + '.json'
+        if os.path.exists(self.cache_path) and os.path.exists(tag_path):
+            with open(tag_path, 'r', encoding='utf-8') as f:
+                if json.load(f).get('tag') == tag:
+                    return
+        tmp_path = self.cache_path + '.tmp.npy'
+        tokens = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.int16, shape=(len(self.cpp_code), 3, self.max_length))
+        pretokenize(self.cpp_code, self.rust_code, self.cpp_tokenizer, self.rust_tokenizer, self.max_length, tokens)
+        tokens.flush()
+        del tokens
+        os.replace(tmp_path, self.cache_path)
+        with open(tag_path, 'w', encoding='utf-8') as f:
+            json.dump({'tag': tag, 'samples': len(self.cpp_code), 'max_length': self.max_length}, f)
+
+    def tokens(self):
+        # Opened lazily, so every DataLoader worker maps the file itself
+        if self._tokens is None:
+            self._tokens = np.load(self.cache_path, mmap_mode='r')
+        return self._tokens
+
+    def __getstate__(self):
+        # Workers get the path of the token file instead of a pickled copy of it
+        state = self.__dict__.copy()
+        if self.cache_path is not None:
+            state['_tokens'] = None
+        return state
 
     def __len__(self):
         return len(self.cpp_code)
 
-    def __getitem__(self, idx):
-        cpp_text = self.cpp_code[idx]
-        rust_text = self.rust_code[idx]
+    def lengths(self):
+        # Non padding tokens of every sample, the longer of its source and target side
+        tokens = self.tokens()
+        source = (tokens[:, 0] != self.cpp_tokenizer.vocab.get('[PAD]')).sum(axis=1)
+        target = (tokens[:, 1:] != self.rust_tokenizer.vocab.get('[PAD]')).sum(axis=2).max(axis=1)
+        return np.maximum(source, target)
 
-        inputs = self.cpp_tokenizer(cpp_text, padding='max_length', truncation=True, max_length=self.max_length, return_tensors='pt')
-        targets = self.rust_tokenizer(rust_text, padding='max_length', truncation=True, max_length=self.max_length, return_tensors='pt')
+    def __getitem__(self, idx):
+        sample = torch.from_numpy(self.tokens()[idx].astype(np.int64))
         return {
-            'encoder_input': inputs['input_ids'],
-            'encoder_mask': inputs['attention_mask'],
-            'labels': targets['labels'],
-            'decoder_input':targets['input_ids'],
-            'decoder_mask':targets['attention_mask']
+            'encoder_input': sample[0],
+            'labels': sample[2],
+            'decoder_input': sample[1],
         }
 
-cpp_tokenizer = CppTokenizer(cpp_vocabulary,config)
-rust_tokenizer = RustTokenizer(rust_vocabulary,config)
+    def collate(self, samples):
+        # Stacks the samples and adds the masks: (batch, 1, 1, seq_len) for the encoder and
+        # (batch, 1, seq_len, seq_len) for the decoder, its causal part shared by every batch
+        batch = {key: torch.stack([sample[key] for sample in samples]) for key in samples[0]}
+        if self.dynamic_padding:
+            # Padding is always on the right, so cutting the columns nobody in the batch uses changes nothing else
+            source_pad, target_pad = self.cpp_tokenizer.vocab.get('[PAD]'), self.rust_tokenizer.vocab.get('[PAD]')
+            source_width = max(int((batch['encoder_input'] != source_pad).sum(dim=1).max()), 1)
+            target_width = max(int((batch['decoder_input'] != target_pad).sum(dim=1).max()), int((batch['labels'] != target_pad).sum(dim=1).max()), 1)
+            batch['encoder_input'] = batch['encoder_input'][:, :source_width]
+            batch['decoder_input'] = batch['decoder_input'][:, :target_width]
+            batch['labels'] = batch['labels'][:, :target_width]
+        batch['encoder_mask'] = (batch['encoder_input'] != self.cpp_tokenizer.vocab.get('[PAD]'))[:, None, None, :].int()
+        decoder_input = batch['decoder_input']
+        batch['decoder_mask'] = (decoder_input != self.rust_tokenizer.vocab.get('[PAD]'))[:, None, None, :].int() & self.rust_tokenizer.causal_mask(decoder_input.size(1))
+        return batch
+
+class BucketBatchSampler(Sampler):
+    # Batches of samples with similar lengths, for a DataLoader with batch_sampler=... and collate_fn=dataset.collate.
+    # Every epoch shuffles the samples, sorts them by length within pools of pool_size batches,
+    # cuts the pools into batches and shuffles the batches, so the order still changes from epoch to epoch
+    def __init__(self, lengths, batch_size, pool_size=50, shuffle=True, drop_last=False, seed=0):
+        self.lengths = np.asarray(lengths)
+        self.batch_size = batch_size
+        self.pool_size = pool_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.seed = seed
+        self.epoch = 0
+
+    def __iter__(self):
+        rng = np.random.default_rng(self.seed + self.epoch)
+        self.epoch += 1
+        order = rng.permutation(len(self.lengths)) if self.shuffle else np.arange(len(self.lengths))
+        pool = self.batch_size * self.pool_size
+        batches = []
+        for pool_start in range(0, len(order), pool):
+            indices = order[pool_start:pool_start + pool]
+            indices = indices[np.argsort(self.lengths[indices], kind='stable')]
+            batches.extend(indices[i:i + self.batch_size] for i in range(0, len(indices), self.batch_size))
+        if self.drop_last and batches and len(batches[-1]) < self.batch_size:
+            batches.pop()
+        if self.shuffle:
+            rng.shuffle(batches)
+        for batch in batches:
+            yield batch.tolist()
 
-def get_model(config):
-    model = build_transformer(cpp_size, rust_size, config["seq_len"], config['seq_len'], d_model=config['d_model'])
-    return model
+    def __len__(self):
+        if self.drop_last:
+            return len(self.lengths) // self.batch_size
+        return -(-len(self.lengths) // self.batch_size)
 
-def causal_mask(size):
-    mask = torch.triu(torch.ones((1, size, size)), diagonal=1).type(torch.int)
-    return mask == 0
+cpp_tokenizer = CppTokenizer(cpp_vocabulary,config)
+rust_tokenizer = RustTokenizer(rust_vocabulary,config,rust_vocabulary_1)
 
-def Validate(model,cpp_code,validate=True):
-    def Convert(decoded, variables, constants, strings):
-        if rust_vocabulary_1['for '] in decoded:
-                variables.pop(0)
-        output_lst = []
-        output_lin = ""
-        var_index = 0
-        const_index = 0
-        str_index = 0
-
-        for i in decoded:
-            if i == rust_vocabulary["[PAD]"]:
-                continue
-            elif i == rust_vocabulary["<var>"]:
-                if var_index < len(variables):
-                    output_lst.append(variables[var_index])
-                    output_lin += variables[var_index]
-                    var_index += 1
-            elif i == rust_vocabulary["<num>"]:
-                if const_index < len(constants):
-                    output_lst.append(constants[const_index])
-                    output_lin += constants[const_index]
-                    const_index += 1
-            elif i == rust_vocabulary["<str>"]:
-                if str_index < len(strings):
-                    output_lst.append(strings[str_index])
-                    output_lin += strings[str_index]
-                    str_index += 1
-            else:
-                for j in rust_vocabulary_1:
-                    if i == rust_vocabulary_1[j]:
-                        output_lst.append(j)
-                        output_lin += j
-                        break
-
-        return output_lin.strip(), output_lst
-
-    def test_model_line_by_line(
-        model, cpp_tokenizer, cpp_lines, max_length, variables=[], constants=[], strings=[]
-    ):
-        cpp_keywords = [
+# A line with one of these words (or a ++/--) goes through the model, every other line is passed through as it is
+CPP_KEYWORDS = frozenset([
     "alignas", "alignof", "asm", "auto", "bitand", "bitor", "bool", "break",
     "case", "catch", "char", "char8_t", "char16_t", "char32_t", "class",
     "const", "constexpr", "const_cast", "continue", "co_await", "co_return",
@@ -476,75 +591,199 @@ def Validate(model,cpp_code,validate=True):
     'vector', 'string', 'map', 'set', 'unordered_map',
     'unique_ptr', 'shared_ptr', 'make_shared', 'bind',
     'thread', 'mutex', 'lock_guard', 'async',
-    'future', 'make_unique', 'move', 'swap']
-        unary_operators = ["++", "--"]
-
-        model.eval()
-        rust_lines = []
-
-        for cpp_line in cpp_lines:
-            cpp_line.strip()
-            variables = []
-            constants = []
-            strings = []
-
-            # Check for keywords and unary operators
-            tokenized_line = cpp_tokenizer.convert_tokens_to_ids(cpp_line,variables,constants,strings,pred=True)
-            has_keywords = any(token in cpp_keywords for token in tokenized_line)
-            has_unary_operators = any(op in cpp_line for op in unary_operators)
-
-            if not has_keywords and not has_unary_operators:
-                rust_lines.append(cpp_line)  # Directly append the same C++ line
-                continue
-
-            with torch.no_grad():
-                inputs = cpp_tokenizer(
-                    cpp_line,
-                    padding="max_length",
-                    truncation=True,
-                    max_length=max_length,
-                    return_tensors="pt",
-                    variables=variables,
-                    constants=constants,
-                    strings=strings,
-                )
-                source = inputs["input_ids"]
-                source_mask = inputs["attention_mask"]
-                encoder_output = model.encode(source, source_mask)
-                decoder_input = torch.empty(1, 1).fill_(rust_vocabulary_1.get('[SOS]')).type_as(source)
-
-                while True:
-                    if decoder_input.size(1) == config["seq_len"]:
-                        break
-
-                    # Build mask for target
-                    decoder_mask = causal_mask(decoder_input.size(1)).type_as(source_mask)
-
-                    # Calculate output
-                    out = model.decode(encoder_output, source_mask, decoder_input, decoder_mask)
-
-                    # Get next token
-                    prob = model.project(out[:, -1])
-                    _, next_word = torch.max(prob, dim=1)
-                    decoder_input = torch.cat(
-                        [decoder_input, torch.empty(1, 1).type_as(source).fill_(next_word.item())], dim=1
-                    )
-                    if next_word == rust_vocabulary_1.get('[EOS]'):  # End token
-                        break
-
-                output = decoder_input.tolist()[0]
-                final_output, _ = Convert(output, variables, constants, strings)
-                rust_lines.append((final_output.lstrip().rstrip())[5:-5])
-
-        return rust_lines
+    'future', 'make_unique', 'move', 'swap'])
+UNARY_OPERATORS = ("++", "--")
+
+class LineGate:
+    # Decides which lines need the model. Keywords in the vocabulary are checked by id against a set
+    # built once, the few that aren't in it are scanned as <var> and checked by name.
+    # ++/-- is looked for in the raw line, as before (so it also counts inside strings and comments)
+    def __init__(self, tokenizer, keywords=CPP_KEYWORDS):
+        self.tokenizer = tokenizer
+        self.keyword_ids = frozenset(tokenizer.vocab[word] for word in keywords if word in tokenizer.vocab)
+        self.unknown_keywords = frozenset(word for word in keywords if word not in tokenizer.vocab)
+
+    def needs_model(self, cpp_line, scan=None):
+        # scan is the line's tokenizer.scan result when the caller already has it
+        token_ids, _, variables, _, _ = scan or self.tokenizer.scan(cpp_line)
+        return (not self.keyword_ids.isdisjoint(token_ids) or not self.unknown_keywords.isdisjoint(variables)
+                or any(op in cpp_line for op in UNARY_OPERATORS))
+
+    def classify(self, cpp_lines, scans=None):
+        # Whole file at once, returns a bool array with True for the lines that need the model
+        if scans is None:
+            scans = [self.tokenizer.scan(cpp_line) for cpp_line in cpp_lines]
+        return np.fromiter(map(self.needs_model, cpp_lines, scans), dtype=bool, count=len(cpp_lines))
+
+line_gate = LineGate(cpp_tokenizer)
+
+def get_model(config, init_weights=True):
+    model = build_transformer(cpp_size, rust_size, config["seq_len"], config['seq_len'], d_model=config['d_model'], init_weights=init_weights)
+    return model
 
+def causal_mask(size):
+    mask = torch.triu(torch.ones((1, size, size)), diagonal=1).type(torch.int)
+    return mask == 0
 
+def Convert(decoded, variables, constants, strings):
+    if rust_vocabulary_1['for '] in decoded:
+            variables.pop(0)
+    output_lst = rust_tokenizer.detokenize(decoded, variables, constants, strings)
+    return "".join(output_lst).strip(), output_lst
+
+def translate_lines(model, cpp_lines, use_cache=True, batch_size=None, cache=None, stats=None, reuse=None):
+    # Generator behind Validate: yields (start_index, rust_lines) chunks in source order,
+    # each chunk as soon as every line in it is translated, so callers can stream the result
+    # reuse maps C++ lines to Rust lines translated by an earlier run, those lines are taken as they are
+    batch_size = batch_size or config["infer_batch_size"]
+    max_length = config["seq_len"]
+    start_time = time.perf_counter()
+
+    if getattr(model, 'training', False): # Resident models are already in eval mode
+        model.eval()
+    rust_lines = [None] * len(cpp_lines)
+    pending = {}  # Placeholder token ids --> lines that need the model for them, translated together in batches below
+    reused_lines = 0
+    stored_lines = 0
+    passthrough_lines = 0
+    cache_hits = 0
+    input_tokens = output_tokens = 0
+    emitted = 0
+    detokenize_seconds = 0.0
+
+    def fill(index, output, variables, constants, strings):
+        nonlocal detokenize_seconds
+        fill_start = time.perf_counter()
+        _, pieces = Convert(output, variables, constants, strings)
+        rust_lines[index] = "".join(pieces)
+        detokenize_seconds += time.perf_counter() - fill_start
+
+    def ready():
+        # The run of finished lines right after the last chunk that was handed out
+        nonlocal emitted
+        start = end = emitted
+        while end < len(rust_lines) and rust_lines[end] is not None:
+            end += 1
+        emitted = end
+        return start, rust_lines[start:end]
+
+    tokenize_start = time.perf_counter()
+    cached_lines = []
+    # Every line is scanned once, its ids feed both the gate and the model
+    scans = {}
+    for index, cpp_line in enumerate(cpp_lines):
+        if reuse is not None and cpp_line in reuse:
+            rust_lines[index] = reuse[cpp_line]
+            stored_lines += 1
+        else:
+            scans[index] = cpp_tokenizer.scan(cpp_line)
+    gated = line_gate.classify([cpp_lines[index] for index in scans], list(scans.values()))
+
+    for (index, (token_ids, _, variables, constants, strings)), needs_model in zip(scans.items(), gated):
+        cpp_line = cpp_lines[index]
+        if not needs_model:
+            rust_lines[index] = cpp_line  # Directly append the same C++ line
+            passthrough_lines += 1
+            continue
+
+        inputs = cpp_tokenizer.pad_inputs(
+            token_ids,
+            padding="max_length",
+            truncation=True,
+            max_length=max_length,
+            return_tensors="pt",
+        )
+        # Lines with the same placeholder ids decode to the same Rust ids, only their own values differ
+        key = tuple(inputs["input_ids"].tolist())
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            cached_lines.append((index, cached, variables, constants, strings))
+            cache_hits += 1
+            reused_lines += 1
+        elif key in pending:
+            pending[key][2].append((index, variables, constants, strings))
+            reused_lines += 1
+        else:
+            length = min(len(token_ids) + 2, max_length) # With [SOS] and [EOS], the rest is padding
+            pending[key] = (inputs["input_ids"], inputs["attention_mask"], [(index, variables, constants, strings)], length)
+            input_tokens += len(token_ids)
+    metrics.observe_stage('tokenize', time.perf_counter() - tokenize_start)
+
+    for line in cached_lines:
+        fill(*line)
+
+    start, chunk = ready()
+    if chunk:
+        yield start, chunk
+
+    sos_id, eos_id = rust_vocabulary_1.get('[SOS]'), rust_vocabulary_1.get('[EOS]')
+    # Lines of similar length are batched together and each batch is only padded to its longest line.
+    # Sorting within a window of a few batches instead of the whole file keeps the stream going early
+    items = list(pending.items())
+    window = batch_size * config.get('infer_bucket_window', 1)
+    items = [item for window_start in range(0, len(items), window)
+             for item in sorted(items[window_start:window_start + window], key=lambda item: item[1][3])]
+    for batch_start in range(0, len(items), batch_size):
+        batch = items[batch_start:batch_start + batch_size]
+        with torch.no_grad():
+            if use_cache:
+                # (batch, width) and (batch, 1, 1, width), every row keeps its own padding mask
+                width = max(item[3] for _, item in batch)
+                source = torch.stack([item[0][:width] for _, item in batch])
+                source_mask = torch.stack([item[1][..., :width] for _, item in batch])
+                outputs = decode_batch(model, source, source_mask, sos_id, eos_id, max_length, config)
+            else:
+                # One line at a time, as a batch of one (the exported model only takes batched inputs)
+                outputs = [greedy_decode(model, item[0].unsqueeze(0), item[1].unsqueeze(0), sos_id, eos_id, max_length) for _, item in batch]
+
+        for (key, (_, _, lines, _)), output in zip(batch, outputs):
+            output_tokens += len(output)
+            if cache is not None:
+                cache.put(key, output)
+            for index, variables, constants, strings in lines:
+                fill(index, output, variables, constants, strings)
+
+        start, chunk = ready()
+        if chunk:
+            yield start, chunk
+
+    metrics.observe_stage('detokenize', detokenize_seconds)
+    metrics.inc('sastra_lines_total', passthrough_lines, route='passthrough')
+    metrics.inc('sastra_lines_total', stored_lines, route='stored')
+    metrics.inc('sastra_lines_total', cache_hits, route='cache')
+    metrics.inc('sastra_lines_total', reused_lines - cache_hits, route='duplicate')
+    metrics.inc('sastra_lines_total', len(items), route='model')
+    metrics.inc('sastra_tokens_total', input_tokens, kind='input')
+    metrics.inc('sastra_tokens_total', output_tokens, kind='output')
+    if cache is not None:
+        metrics.inc('sastra_cache_lookups_total', cache_hits, result='hit')
+        metrics.inc('sastra_cache_lookups_total', len(cpp_lines) - passthrough_lines - stored_lines - cache_hits, result='miss')
+
+    if stats is not None:
+        seconds = time.perf_counter() - start_time
+        stats.update({
+            'lines': len(cpp_lines),
+            'model_lines': len(items) + reused_lines,
+            'reused_lines': reused_lines,
+            'stored_lines': stored_lines,
+            'passthrough_lines': passthrough_lines,
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'seconds': seconds,
+            'lines_per_sec': len(cpp_lines) / seconds if seconds else 0.0,
+        })
+
+def Validate(model,cpp_code,validate=True,use_cache=True,batch_size=None,stats=None,cache=None,reuse=None):
+    stats = {} if stats is None else stats
     cpp_lines = cpp_code.strip().split('\n')
-    rust_lines = test_model_line_by_line(model, cpp_tokenizer, cpp_lines, config["seq_len"])
+    rust_lines = []
+    for _, chunk in translate_lines(model, cpp_lines, use_cache, batch_size, cache, stats, reuse):
+        rust_lines.extend(chunk)
     if(validate==True):
         print("Line-by-line conversion of C++ to Rust:")
         for cpp_line, rust_line in zip(cpp_lines, rust_lines):
             print(f"C++: {cpp_line}\nRust: {rust_line}\n")
+        print(f"{stats['lines']} lines ({stats['model_lines']} through the model) in {stats['seconds']:.2f}s, {stats['lines_per_sec']:.1f} lines/sec")
     else:
       rust_program='\n'.join(rust_lines)
       return rust_program
@@ -576,11 +815,8 @@ def process_and_convert():
     try:
         with open(input_file, "r", encoding="utf-8") as f:
             cpp_code = f.read()
-            training_pth=resource_path("Training_1_24.pth")
-            config = get_config()
-            model = get_model(config)
-            checkpoint = torch.load(training_pth,map_location=torch.device('cpu'))
-            model.load_state_dict(checkpoint['model_state_dict'])
+            from model_registry import get_resident_model
+            model = get_resident_model(resource_path("Training_1_24.pth"))
             rust_code = Validate(model,cpp_code,validate=False)  # Convert C++ to Rust
         
         with open(rust_file, "w", encoding="utf-8") as f:
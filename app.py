@@ -1,13 +1,38 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context, g
 from flask_cors import CORS
+import json
 import os
-import sys
-import torch
+import time
 import sastra
-from SASTRA_Code_Converter_DL import get_config, get_model, Validate
+import model_registry
+import jobs
+import metrics
+from SASTRA_Code_Converter_DL import Validate, translate_lines
 
 app = Flask(__name__)
 CORS(app)
+job_queue = jobs.JobQueue(int(os.environ.get('SASTRA_JOB_WORKERS', 2)), int(os.environ.get('SASTRA_JOB_QUEUE', 16)))
+
+@app.before_request
+def start_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request(response):
+    # Streaming responses are counted when their headers go out, not when the stream ends
+    endpoint = request.endpoint or 'unknown'
+    metrics.observe_latency('sastra_request_seconds', time.perf_counter() - g.request_start, endpoint=endpoint)
+    metrics.inc('sastra_requests_total', endpoint=endpoint, status=response.status_code)
+    return response
+
+def request_data():
+    # The JSON body as a dict, {} when it is missing, not JSON or not an object (the handlers then answer 400)
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else {}
+
+def wants_timing(data):
+    # Per-stage timings go into the response when the client asks for them ({"timing": true} or ?timing=1)
+    return bool(data.get('timing')) or request.args.get('timing') == '1'
 
 @app.route('/', methods=['GET'])
 def home():
@@ -15,59 +40,263 @@ def home():
 
 @app.route('/ping', methods=['GET'])
 def ping():
-    return jsonify({'status': 'ok'})
+    return jsonify({'status': 'ok', 'model_loaded': model_registry.is_loaded(), 'jobs': job_queue.stats()})
 
 
 @app.route('/convert', methods=['POST'])
 def convert_rule_based():
-    data = request.get_json()
+    data = request_data()
     cpp_code = data.get('code')
     output_folder = data.get('output_folder')
+    if cpp_code is None:
+        return jsonify({'error': 'No code given'}), 400
 
     try:
-        input_path = os.path.join(output_folder, 'input.cpp')
-        with open(input_path, 'w', encoding='utf-8') as f:
-            f.write(cpp_code)
-
-        intermediate_path = os.path.join(output_folder, 'output.txt')
-        output_path = os.path.join(output_folder, 'output_sastra.rs')
-        sastra.preprocess(input_path, intermediate_path)
-        sastra.convert(intermediate_path, output_path)
+        with metrics.breakdown() as timing:
+            # The whole pipeline runs in memory, only the result is written (and only when a folder is given)
+            rust_code = sastra.convert_text(sastra.preprocess_text(cpp_code))
+            output_path = os.path.join(output_folder, 'output_sastra.rs') if output_folder else None
+            result = write_result(rust_code, output_path)
 
-        return jsonify({'message': 'Rule-based conversion complete!'})
+        result['message'] = 'Rule-based conversion complete!'
+        if wants_timing(data):
+            result['timing'] = timing
+        return jsonify(result)
     except Exception as e:
         print(f"[ERROR] Rule-based conversion failed: {e}")
+        metrics.inc('sastra_errors_total', endpoint='convert')
         return jsonify({'error': str(e)}), 500
 
 @app.route('/convert_ai', methods=['POST'])
 def convert_ai():
-    data = request.get_json()
+    data = request_data()
     cpp_code = data.get('code')
     output_folder = data.get('output_folder')
+    if cpp_code is None:
+        return jsonify({'error': 'No code given'}), 400
+    if not output_folder:
+        return jsonify({'error': 'No output folder given'}), 400
 
     try:
-        config = get_config()
-        model = get_model(config)
-        if getattr(sys, 'frozen', False):
-            base_path = sys._MEIPASS
-        else:
-            base_path = os.path.dirname(__file__)
-
-        model_path = os.path.join(base_path, 'Training_1_24.pth')
-        checkpoint = torch.load(model_path, map_location=torch.device('cpu'))
-        model.load_state_dict(checkpoint['model_state_dict'])
-        model.eval()
-
-        rust_code = Validate(model, cpp_code, validate=False)
-        output_path = os.path.join(output_folder, 'output_ai.rs')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(rust_code)
+        with metrics.breakdown() as timing:
+            model = model_registry.get_resident_model()
+            cache = model_registry.get_translation_cache()
+            stats = {}
+            rust_code = Validate(model, cpp_code, validate=False, stats=stats, cache=cache)
+            with metrics.timed('file_io'):
+                cache.save()
+                output_path = os.path.join(output_folder, 'output_ai.rs')
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(rust_code)
 
-        return jsonify({'message': 'AI conversion complete!'})
+        print(f"AI conversion: {stats['lines']} lines in {stats['seconds']:.2f}s ({stats['lines_per_sec']:.1f} lines/sec)")
+        result = {'message': 'AI conversion complete!', 'stats': stats}
+        if wants_timing(data):
+            result['timing'] = timing
+        return jsonify(result)
     except Exception as e:
         print(f"[ERROR] AI conversion failed: {e}")
+        metrics.inc('sastra_errors_total', endpoint='convert_ai')
         return jsonify({'error': str(e)}), 500
 
+def ndjson_response(events):
+    # One JSON object per line, flushed as soon as it is yielded
+    def generate():
+        for event in events:
+            yield json.dumps(event) + '\n'
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def stream_to_file(chunks, output_path, total):
+    # Reports each batch of converted lines to the client, and writes them to output_path as they arrive when there is one
+    done = 0
+    io_seconds = 0.0
+    f = open(output_path, 'w', encoding='utf-8') if output_path else None
+    try:
+        for lines in chunks:
+            if f:
+                io_start = time.perf_counter()
+                if done:
+                    f.write('\n')
+                f.write('\n'.join(lines))
+                f.flush()
+                io_seconds += time.perf_counter() - io_start
+            done += len(lines)
+            yield {'type': 'lines', 'lines': lines, 'done': done, 'total': total}
+    finally:
+        if f:
+            f.close()
+            metrics.observe_stage('file_io', io_seconds)
+
+@app.route('/convert_stream', methods=['POST'])
+def convert_rule_based_stream():
+    data = request_data()
+    cpp_code = data.get('code')
+    output_folder = data.get('output_folder')
+    if cpp_code is None:
+        return jsonify({'error': 'No code given'}), 400
+
+    timing_requested = wants_timing(data)
+
+    def events():
+        try:
+            with metrics.breakdown() as timing:
+                output_path = os.path.join(output_folder, 'output_sastra.rs') if output_folder else None
+                # The rule-based pass can turn one C++ line into several Rust lines, so there is no total up front
+                chunks = sastra.iter_convert_text(sastra.preprocess_text(cpp_code))
+                yield from stream_to_file(chunks, output_path, None)
+            complete = {'type': 'complete', 'output_path': output_path}
+            if timing_requested:
+                complete['timing'] = timing
+            yield complete
+        except Exception as e:
+            print(f"[ERROR] Rule-based conversion failed: {e}")
+            metrics.inc('sastra_errors_total', endpoint='convert_stream')
+            yield {'type': 'error', 'error': str(e)}
+
+    return ndjson_response(events())
+
+@app.route('/convert_ai_stream', methods=['POST'])
+def convert_ai_stream():
+    data = request_data()
+    cpp_code = data.get('code')
+    output_folder = data.get('output_folder')
+    if cpp_code is None:
+        return jsonify({'error': 'No code given'}), 400
+
+    timing_requested = wants_timing(data)
+
+    def events():
+        try:
+            with metrics.breakdown() as timing:
+                model = model_registry.get_resident_model()
+                cache = model_registry.get_translation_cache()
+                stats = {}
+                cpp_lines = cpp_code.strip().split('\n')
+                output_path = os.path.join(output_folder, 'output_ai.rs') if output_folder else None
+                chunks = (lines for _, lines in translate_lines(model, cpp_lines, cache=cache, stats=stats))
+                yield from stream_to_file(chunks, output_path, len(cpp_lines))
+                with metrics.timed('file_io'):
+                    cache.save()
+
+            print(f"AI conversion: {stats['lines']} lines in {stats['seconds']:.2f}s ({stats['lines_per_sec']:.1f} lines/sec)")
+            complete = {'type': 'complete', 'output_path': output_path, 'stats': stats}
+            if timing_requested:
+                complete['timing'] = timing
+            yield complete
+        except Exception as e:
+            print(f"[ERROR] AI conversion failed: {e}")
+            metrics.inc('sastra_errors_total', endpoint='convert_ai_stream')
+            yield {'type': 'error', 'error': str(e)}
+
+    return ndjson_response(events())
+
+def write_result(rust_code, output_path):
+    # Like /convert: the path of the written file when there is a folder to write to, otherwise the code itself
+    if not output_path:
+        return {'code': rust_code}
+    with metrics.timed('file_io'):
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(rust_code)
+    return {'output_path': output_path}
+
+def run_rule_job(job, cpp_code, output_folder):
+    rust_lines = []
+    for lines in sastra.iter_convert_text(sastra.preprocess_text(cpp_code)):
+        job.check_cancelled()
+        rust_lines.extend(lines)
+        job.done = len(rust_lines)
+    output_path = os.path.join(output_folder, 'output_sastra.rs') if output_folder else None
+    return write_result('\n'.join(rust_lines), output_path)
+
+def run_ai_job(job, cpp_code, output_folder):
+    model = model_registry.get_resident_model()
+    cache = model_registry.get_translation_cache()
+    stats = {}
+    cpp_lines = cpp_code.strip().split('\n')
+    job.total = len(cpp_lines)
+    rust_lines = []
+    # Cancelling takes effect between two decoded batches
+    for _, lines in translate_lines(model, cpp_lines, cache=cache, stats=stats):
+        job.check_cancelled()
+        rust_lines.extend(lines)
+        job.done = len(rust_lines)
+    with metrics.timed('file_io'):
+        cache.save()
+
+    print(f"AI conversion: {stats['lines']} lines in {stats['seconds']:.2f}s ({stats['lines_per_sec']:.1f} lines/sec)")
+    output_path = os.path.join(output_folder, 'output_ai.rs') if output_folder else None
+    result = write_result('\n'.join(rust_lines), output_path)
+    result['stats'] = stats
+    return result
+
+JOB_KINDS = {'rule': run_rule_job, 'ai': run_ai_job}
+
+@app.route('/jobs', methods=['POST'])
+def submit_job():
+    data = request_data()
+    mode = data.get('mode', 'ai')
+    cpp_code = data.get('code')
+    output_folder = data.get('output_folder')
+    run = JOB_KINDS.get(mode)
+    if run is None:
+        return jsonify({'error': f"Unknown mode '{mode}', expected one of {sorted(JOB_KINDS)}"}), 400
+    if cpp_code is None:
+        return jsonify({'error': 'No code given'}), 400
+
+    timing_requested = wants_timing(data)
+
+    def target(job):
+        with metrics.breakdown() as timing:
+            result = run(job, cpp_code, output_folder)
+        if timing_requested:
+            result['timing'] = timing
+        return result
+
+    try:
+        job = job_queue.submit(mode, target)
+    except jobs.QueueFull as e:
+        return jsonify({'error': f"Too many conversions waiting, try again later ({e})"}), 429
+    return jsonify(job.to_dict()), 202
+
+@app.route('/jobs', methods=['GET'])
+def job_stats():
+    return jsonify(job_queue.stats())
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    job = job_queue.cancel(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    # Prometheus text format; the gauges are read at scrape time. Only the settings and sizes are read here:
+    # queued/running jobs are sastra_jobs_active, cache hits/misses are sastra_cache_lookups_total
+    metrics.set_gauge('sastra_model_loaded', int(model_registry.is_loaded()))
+    job_stats = job_queue.stats()
+    for name in ('workers', 'max_queued'):
+        metrics.set_gauge(f'sastra_jobs_{name}', job_stats[name])
+    cache_stats = model_registry.get_translation_cache().stats()
+    for name in ('entries', 'capacity'):
+        metrics.set_gauge(f'sastra_translation_cache_{name}', cache_stats[name])
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/cache', methods=['GET'])
+def cache_stats():
+    return jsonify(model_registry.get_translation_cache().stats())
+
 if __name__ == '__main__':
     print('>>> Flask backend starting on http://127.0.0.1:5000')
-    app.run(host='127.0.0.1', port=5000)
+    # Load the model in the background so the first AI request doesn't pay for it
+    if os.environ.get('SASTRA_WARMUP', '1') != '0':
+        model_registry.warm_up()
+    # Every request gets its own thread, conversions themselves run on the job pool
+    app.run(host='127.0.0.1', port=5000, threaded=True)
@@ -0,0 +1,198 @@
+#Converts a whole source tree: every C++ file under the input folder is translated by a pool of worker processes
+#and written to the same relative path under the output folder, with a summary of the run next to it.
+#A manifest in the output folder remembers what was converted, so a re-run only converts the files that changed.
+#Usage: python batch_convert.py src_dir out_dir [--mode rule|ai] [--workers N] [--force]
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from tqdm import tqdm
+import sastra
+from manifest import Manifest, MANIFEST_NAME, file_hash, text_hash
+
+CPP_EXTENSIONS = ('.cpp', '.cc', '.cxx', '.hpp', '.h')
+SUMMARY_NAME = 'conversion_summary.json'
+
+# Per worker process state, filled once by init_worker
+_worker = {}
+
+def find_sources(src_dir, extensions=CPP_EXTENSIONS):
+    # Relative paths of the C++ files under src_dir, in a stable order
+    sources = []
+    for root, dirs, files in os.walk(src_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(extensions):
+                sources.append(os.path.relpath(os.path.join(root, name), src_dir))
+    return sources
+
+def output_paths(sources):
+    # foo/bar.cpp --> foo/bar.rs, unless another source already maps there (bar.cpp and bar.h), then foo/bar.h.rs
+    taken = set()
+    paths = {}
+    for source in sources:
+        target = os.path.splitext(source)[0] + '.rs'
+        if target in taken:
+            target = source + '.rs'
+        taken.add(target)
+        paths[source] = target
+    return paths
+
+def init_worker(mode, model_path=None, quantized=None, threads=None):
+    # Runs once in every worker process, so each of them loads the model a single time
+    _worker['mode'] = mode
+    if mode == 'ai':
+        import torch
+        import model_registry
+        if threads:
+            # Without this every worker would start one torch thread per core and they would fight over the CPU
+            torch.set_num_threads(threads)
+        _worker['model'] = model_registry.get_resident_model(model_path, quantized)
+        _worker['cache'] = model_registry.get_translation_cache(model_path)
+
+def translate_source(cpp_code, stored=None):
+    # ai mode: stored maps line hashes to the Rust lines of the previous version of the file,
+    # only the lines not found there go to the model
+    from SASTRA_Code_Converter_DL import translate_lines
+    stored = stored or {}
+    cpp_lines = cpp_code.strip().split('\n')
+    hashes = [text_hash(line) for line in cpp_lines]
+    reuse = {line: stored[h] for line, h in zip(cpp_lines, hashes) if h in stored}
+    rust_lines = []
+    for _, chunk in translate_lines(_worker['model'], cpp_lines, cache=_worker['cache'], reuse=reuse):
+        rust_lines.extend(chunk)
+    # Lines the gate passes through unchanged are cheap to redo and would only bloat the manifest
+    lines = {h: rust_line for h, cpp_line, rust_line in zip(hashes, cpp_lines, rust_lines) if rust_line != cpp_line}
+    return '\n'.join(rust_lines), lines, len(reuse)
+
+def convert_source(cpp_code, stored=None):
+    if _worker['mode'] == 'ai':
+        return translate_source(cpp_code, stored)
+    # The rule-based converter prints while it works, which would garble the progress bar.
+    # Its rules carry state from line to line (declared types, class bodies), so only whole files are reused
+    with contextlib.redirect_stdout(io.StringIO()):
+        return sastra.convert_text(sastra.preprocess_text(cpp_code)), None, 0
+
+def convert_file(input_path, output_path, stored=None):
+    # Returns a summary entry instead of raising, so one bad file doesn't stop the whole run
+    start = time.perf_counter()
+    entry = {'input': input_path, 'output': output_path, 'status': 'ok', 'lines': 0, 'stored_lines': 0, 'seconds': 0.0, 'error': None}
+    try:
+        with open(input_path, 'rb') as f:
+            data = f.read()
+        entry['source_hash'] = hashlib.sha256(data).hexdigest()
+        cpp_code = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        entry['lines'] = cpp_code.count('\n') + 1
+        rust_code, entry['line_outputs'], entry['stored_lines'] = convert_source(cpp_code, stored)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(rust_code)
+        entry['output_hash'] = file_hash(output_path)
+    except Exception as e:
+        entry['status'] = 'error'
+        entry['error'] = f"{type(e).__name__}: {e}"
+    entry['seconds'] = time.perf_counter() - start
+    return entry
+
+def open_manifest(path, mode, model_path=None, quantized=None):
+    if mode != 'ai':
+        return Manifest(path, mode)
+    import model_registry
+    model_path = model_path or model_registry.checkpoint_path()
+    quantized = model_registry.quantize_enabled() if quantized is None else quantized
+    return Manifest(path, mode, model_path, model_registry.checkpoint_tag(model_path), quantized)
+
+def convert_tree(src_dir, out_dir, mode='rule', workers=None, extensions=CPP_EXTENSIONS, model_path=None, quantized=None, threads=None,
+                 progress=True, manifest_path=None, force=False):
+    start = time.perf_counter()
+    sources = find_sources(src_dir, extensions)
+    targets = output_paths(sources)
+    workers = max(1, workers or os.cpu_count() or 1)
+    if mode == 'ai' and threads is None:
+        threads = max(1, (os.cpu_count() or 1) // workers)
+
+    manifest = open_manifest(manifest_path or os.path.join(out_dir, MANIFEST_NAME), mode, model_path, quantized)
+    files = []
+    pending = []
+    for source in sources:
+        input_path, output_path = os.path.join(src_dir, source), os.path.join(out_dir, targets[source])
+        if not force and manifest.unchanged(source, file_hash(input_path), targets[source], output_path):
+            files.append({'input': input_path, 'output': output_path, 'status': 'unchanged', 'lines': 0, 'stored_lines': 0, 'seconds': 0.0, 'error': None})
+        else:
+            pending.append(source)
+
+    # Biggest files first, so a large file picked up last doesn't leave the other workers idle at the end
+    pending.sort(key=lambda source: os.path.getsize(os.path.join(src_dir, source)), reverse=True)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending)), initializer=init_worker, initargs=(mode, model_path, quantized, threads)) as executor:
+            futures = {executor.submit(convert_file, os.path.join(src_dir, source), os.path.join(out_dir, targets[source]),
+                                       None if force else manifest.line_outputs(source)): source for source in pending}
+            for future in tqdm(as_completed(futures), total=len(futures), unit='file', disable=not progress):
+                source, entry = futures[future], future.result()
+                if entry['status'] == 'ok':
+                    manifest.record(source, entry.pop('source_hash'), targets[source], entry.pop('output_hash'), entry.pop('line_outputs'))
+                else:
+                    manifest.forget(source)
+                for name in ('source_hash', 'output_hash', 'line_outputs'):
+                    entry.pop(name, None)
+                files.append(entry)
+    manifest.prune(sources)
+    manifest.save()
+    seconds = time.perf_counter() - start
+
+    files.sort(key=lambda entry: entry['input'])
+    lines = sum(entry['lines'] for entry in files)
+    summary = {
+        'mode': mode,
+        'source': os.path.abspath(src_dir),
+        'output': os.path.abspath(out_dir),
+        'workers': workers,
+        'files': len(files),
+        'converted': sum(entry['status'] == 'ok' for entry in files),
+        'unchanged': sum(entry['status'] == 'unchanged' for entry in files),
+        'failed': sum(entry['status'] == 'error' for entry in files),
+        'lines': lines,
+        'stored_lines': sum(entry['stored_lines'] for entry in files),
+        'seconds': seconds,
+        'lines_per_sec': lines / seconds if seconds else 0.0,
+        'results': files,
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, SUMMARY_NAME), 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Convert every C++ file under a folder to Rust')
+    parser.add_argument('src_dir')
+    parser.add_argument('out_dir')
+    parser.add_argument('--mode', choices=['rule', 'ai'], default='rule')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (defaults to the number of CPUs)')
+    parser.add_argument('--threads', type=int, default=None, help='torch threads per worker in ai mode (defaults to CPUs / workers)')
+    parser.add_argument('--ext', nargs='+', default=list(CPP_EXTENSIONS), help='file extensions to convert')
+    parser.add_argument('--checkpoint', default=None)
+    parser.add_argument('--quantize', action='store_true', help='use the int8 model in ai mode')
+    parser.add_argument('--manifest', default=None, help=f'manifest of the previous run (defaults to out_dir/{MANIFEST_NAME})')
+    parser.add_argument('--force', action='store_true', help='convert every file again, even the unchanged ones')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.src_dir):
+        sys.exit(f"[ERROR] {args.src_dir} is not a folder")
+    extensions = tuple(ext.lower() if ext.startswith('.') else '.' + ext.lower() for ext in args.ext)
+    summary = convert_tree(args.src_dir, args.out_dir, args.mode, args.workers, extensions,
+                           args.checkpoint, args.quantize or None, args.threads, manifest_path=args.manifest, force=args.force)
+
+    print(f"{summary['converted']}/{summary['files']} files converted ({summary['unchanged']} unchanged), "
+          f"{summary['lines']} lines in {summary['seconds']:.2f}s ({summary['lines_per_sec']:.0f} lines/sec, {summary['workers']} workers)")
+    if summary['stored_lines']:
+        print(f"{summary['stored_lines']} lines reused from the previous run")
+    for entry in summary['results']:
+        if entry['status'] == 'error':
+            print(f"  [ERROR] {entry['input']}: {entry['error']}")
+    print(f"Summary written to {os.path.join(args.out_dir, SUMMARY_NAME)}")
@@ -0,0 +1,408 @@
+#Micro-benchmarks for the conversion pipeline.
+#Usage: python benchmark.py tokenizer|rules|classes [--input file.cpp]
+#       python benchmark.py full [--sizes 10 1000 100000] [--output run.json] [--baseline old.json]
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+import sastra
+from SASTRA_Code_Converter_DL import cpp_tokenizer, CPP_TOKEN_SPECIFICATION, config
+
+SAMPLE_LINES = [
+    'for (int i = 0; i < n; i++) {',
+    'cout << "total: " << total << endl;',
+    'int square = x * x;',
+    'if (count >= limit && !done) {',
+    'std::vector<int> values(10, 0);',
+    'name = "hello world";',
+    'while (total > 0) { total -= 3; }',
+    'return a + b * 2.5;',
+]
+
+def current_rss_mb():
+    # Resident memory of this process: psutil when it is installed, otherwise /proc, otherwise the peak from resource
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except ImportError:
+        return None
+
+def peak_rss_mb():
+    # Highest resident memory of this process so far
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == 'darwin' else peak / 1024 # bytes on macOS, KiB elsewhere
+    except ImportError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / 2**20 # Windows
+    except (ImportError, AttributeError):
+        return current_rss_mb()
+
+def uncompiled_tokenize(code):
+    # How a line was tokenized before the scanners were compiled at import:
+    # the specification was joined and handed to re.finditer on every call
+    vocab = cpp_tokenizer.vocab
+    token_re = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in CPP_TOKEN_SPECIFICATION)
+    tokens, variables, constants, strings = [], [], [], []
+    for match in re.finditer(token_re, code, re.DOTALL | re.MULTILINE):
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind in ['NEWLINE', 'WHITESPACE']:
+            continue
+        elif (value not in vocab) and (kind == 'WORD'):
+            tokens.append(vocab.get('<var>'))
+            variables.append(value)
+        elif (value not in vocab) and (kind == 'NUMBER'):
+            tokens.append(vocab.get('<num>'))
+            constants.append(value)
+        elif (value not in vocab) and (kind in ['STRING', 'CHAR']):
+            tokens.append(vocab.get('<str>'))
+            strings.append(value)
+        elif value in vocab:
+            tokens.append(vocab.get(value))
+    return tokens
+
+def bench_tokenizer(lines, repeat=2000):
+    token_count = len(cpp_tokenizer.scan('\n'.join(lines))[0]) * repeat
+
+    # Before: Validate tokenized every line twice (keyword check, then the model input)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for line in lines:
+            uncompiled_tokenize(line)
+            uncompiled_tokenize(line)
+    before = time.perf_counter() - start
+
+    # After: one pass of the compiled scanner gives ids, surface tokens and side lists
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for line in lines:
+            cpp_tokenizer.scan(line)
+    after = time.perf_counter() - start
+
+    print(f"tokenizer: {token_count} tokens")
+    print(f"  before: {token_count / before:12.0f} tokens/sec")
+    print(f"  after:  {token_count / after:12.0f} tokens/sec ({before / after:.1f}x)")
+
+def bench_rules(lines, repeat=200):
+    # Which rules of the rule-based second pass fire and what each of them costs
+    cpp_code = sastra.preprocess_text('\n'.join(lines))
+    rule_stats = {}
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()): # Some rules print while converting
+        for _ in range(repeat):
+            sastra.convert_text(cpp_code, rule_stats)
+    seconds = time.perf_counter() - start
+    line_count = len(cpp_code.split('\n')) * repeat
+
+    print(f"rules: {line_count} lines in {seconds:.2f}s ({line_count / seconds:.0f} lines/sec, timed)")
+    print(f"  {'rule':<36} {'hits':>8} {'ms':>10} {'us/hit':>8}")
+    for name, entry in sorted(rule_stats.items(), key=lambda item: item[1]['seconds'], reverse=True):
+        print(f"  {name:<36} {entry['hits']:>8} {entry['seconds'] * 1000:>10.1f} {entry['seconds'] / entry['hits'] * 1e6:>8.1f}")
+
+def generate_class(name, members, methods):
+    # A class with `members` fields and `methods` methods, each method reading and writing a few of the fields
+    lines = [f'class {name} {{', 'public:']
+    lines += [f'    int field{i};' for i in range(members)]
+    lines.append(f'    {name}(int v) {{ field0 = v; }}')
+    for i in range(methods):
+        a, b, c = i % members, (i * 7 + 3) % members, (i * 13 + 5) % members
+        lines.append(f'    int method{i}(int step) {{ field{a} = field{b} + step; if (step > 0) {{ field{c} += 1; }} return field{a}; }}')
+    lines.append('};')
+    return '\n'.join(lines)
+
+def bench_classes(sizes=(100, 200, 400, 800), repeat=3):
+    # Class conversion time should grow linearly with the class size
+    print(f"classes: {'members':>8} {'methods':>8} {'lines':>8} {'ms':>10} {'lines/sec':>12}")
+    for size in sizes:
+        cpp_code = generate_class('Generated', size, size)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            sastra.cpp_to_rust_class_converter(cpp_code)
+        seconds = (time.perf_counter() - start) / repeat
+        lines = cpp_code.count('\n') + 1
+        print(f"         {size:>8} {size:>8} {lines:>8} {seconds * 1000:>10.1f} {lines / seconds:>12.0f}")
+
+def corpus_blocks(rng, index):
+    # One self-contained piece of C++ per call, picked at random among the constructs the converters handle
+    k = rng.randint(2, 99)
+    kind = rng.choice(['loop', 'switch', 'io', 'template', 'class'])
+    if kind == 'loop':
+        return [
+            f'int sum{index}(int n) {{',
+            '    int total = 0;',
+            '    for (int i = 0; i < n; i++) {',
+            f'        total += i * {k};',
+            '    }',
+            f'    while (total > {k * 10}) {{ total -= {k}; }}',
+            '    return total;',
+            '}',
+        ]
+    if kind == 'switch':
+        return [
+            f'void describe{index}(int value) {{',
+            '    switch (value) {',
+            '        case 1:',
+            '            cout << "one" << endl;',
+            '            break;',
+            f'        case {k}:',
+            f'            cout << "{k}" << endl;',
+            '            break;',
+            '        default:',
+            '            cout << "other" << endl;',
+            '    }',
+            '}',
+        ]
+    if kind == 'io':
+        return [
+            f'void read{index}() {{',
+            '    int count;',
+            '    cin >> count;',
+            '    string name = "item";',
+            f'    double ratio = count / {k}.0;',
+            '    cout << name << ": " << count << " " << ratio << endl;',
+            '}',
+        ]
+    if kind == 'template':
+        return [
+            'template <typename T>',
+            f'T largest{index}(T a, T b) {{',
+            '    if (a > b) {',
+            '        return a;',
+            '    }',
+            '    return b;',
+            '}',
+        ]
+    return generate_class(f'Shape{index}', rng.randint(2, 5), rng.randint(1, 4)).split('\n')
+
+def generate_corpus(size, seed=0):
+    # A synthetic C++ program of about `size` lines, the same one for the same size and seed
+    rng = random.Random(seed)
+    lines = ['#include <iostream>', '#include <string>', 'using namespace std;']
+    index = 0
+    while len(lines) < size - 4:
+        lines += corpus_blocks(rng, index)
+        index += 1
+    lines += ['int main() {', '    cout << "done" << endl;', '    return 0;', '}']
+    return '\n'.join(lines)
+
+def percentile(values, p):
+    # Linear interpolation between the closest ranks
+    values = sorted(values)
+    position = (len(values) - 1) * p
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+def time_stage(run, lines, repeat):
+    # Runs run() repeat times and summarizes the latencies
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        seconds.append(time.perf_counter() - start)
+    p50 = percentile(seconds, 0.5)
+    return {
+        'lines': lines,
+        'runs': repeat,
+        'p50_ms': p50 * 1000,
+        'p95_ms': percentile(seconds, 0.95) * 1000,
+        'lines_per_sec': lines / p50 if p50 else 0.0,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+def bench_rule_stages(cpp_code, repeat):
+    # The rule-based engine and the tokenizer in front of the model, on one corpus
+    lines = cpp_code.split('\n')
+    preprocessed = sastra.preprocess_text(cpp_code)
+    quiet = contextlib.redirect_stdout(io.StringIO()) # Some rules print while converting
+
+    def convert():
+        with quiet:
+            sastra.convert_text(preprocessed)
+
+    def tokenize():
+        for line in lines:
+            cpp_tokenizer.scan(line)
+
+    return {
+        'preprocess': time_stage(lambda: sastra.preprocess_text(cpp_code), len(lines), repeat),
+        'convert': time_stage(convert, len(lines), repeat),
+        'class_converter': time_stage(lambda: sastra.cpp_to_rust_class_converter(cpp_code), len(lines), repeat),
+        'tokenize': time_stage(tokenize, len(lines), repeat),
+    }
+
+def model_inputs(lines):
+    # The padded (ids, mask) batch the model sees for these lines
+    import torch
+    inputs = [cpp_tokenizer.pad_inputs(cpp_tokenizer.scan(line)[0], max_length=config['seq_len'], return_tensors='pt') for line in lines]
+    return torch.stack([item['input_ids'] for item in inputs]), torch.stack([item['attention_mask'] for item in inputs])
+
+def model_line_agreement(cpp_lines, lines_a, lines_b):
+    # Exact-match rate of two translations over the lines that go through the model,
+    # passthrough lines are copied as they are by both and would always match
+    from SASTRA_Code_Converter_DL import line_gate
+    gated = line_gate.classify(cpp_lines)
+    model_lines = int(gated.sum())
+    matches = sum(a == b for a, b, needs_model in zip(lines_a, lines_b, gated) if needs_model)
+    return {
+        'model_lines': model_lines,
+        'passthrough_lines': len(cpp_lines) - model_lines,
+        'exact_match_rate': matches / model_lines if model_lines else 0.0,
+    }
+
+def bench_model_stages(model, cpp_code, repeat, max_lines=256):
+    # Encoder throughput over the first max_lines non-empty lines, and the latency of one cached decode step
+    # (a fixed number of steps, with no early stop at [EOS], so runs stay comparable whatever the weights predict)
+    import torch
+    from SASTRA_Code_Converter_DL import rust_vocabulary_1
+    lines = [line for line in cpp_code.split('\n') if line.strip()][:max_lines]
+    batch_size = config['infer_batch_size']
+    max_len = config['seq_len']
+    source, source_mask = model_inputs(lines)
+    batches = [(source[i:i + batch_size], source_mask[i:i + batch_size]) for i in range(0, len(lines), batch_size)]
+
+    def encode():
+        for ids, mask in batches:
+            model.encode(ids, mask)
+
+    step_seconds = []
+    def decode():
+        ids, mask = batches[0]
+        cache = model.init_decode_cache(model.encode(ids, mask), max_len)
+        token = torch.full((ids.shape[0], 1), rust_vocabulary_1.get('[SOS]'), dtype=ids.dtype)
+        for _ in range(max_len - 1):
+            start = time.perf_counter()
+            out = model.decode_step(mask, token, cache)
+            token = torch.argmax(model.project(out[:, -1]), dim=1, keepdim=True)
+            step_seconds.append(time.perf_counter() - start)
+
+    model.eval()
+    with torch.no_grad():
+        results = {'encode': time_stage(encode, len(lines), repeat)}
+        decode()
+        step_seconds.clear() # The first pass only warms up the caches
+        for _ in range(repeat):
+            decode()
+    tokens = batches[0][0].shape[0]
+    p50 = percentile(step_seconds, 0.5)
+    results['decode_step'] = {
+        'lines': tokens, # One token for each line of the batch per step
+        'runs': len(step_seconds),
+        'p50_ms': p50 * 1000,
+        'p95_ms': percentile(step_seconds, 0.95) * 1000,
+        'tokens_per_sec': tokens / p50 if p50 else 0.0,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    return results
+
+def bench_full(sizes, repeat, model=None, model_label=None, seed=0, model_lines=256):
+    results = {}
+    for size in sizes:
+        cpp_code = generate_corpus(size, seed)
+        stages = bench_rule_stages(cpp_code, repeat)
+        if model is not None:
+            stages.update(bench_model_stages(model, cpp_code, repeat, model_lines))
+        for stage, entry in stages.items():
+            results.setdefault(stage, {})[str(size)] = entry
+            rate = entry.get('lines_per_sec') or entry.get('tokens_per_sec')
+            unit = 'lines/sec' if 'lines_per_sec' in entry else 'tokens/sec'
+            print(f"{stage:<16} {size:>7} lines  p50 {entry['p50_ms']:>10.2f} ms  p95 {entry['p95_ms']:>10.2f} ms  {rate:>12.0f} {unit}")
+
+    import torch
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'torch': torch.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'torch_threads': torch.get_num_threads(),
+            'model': model_label,
+            'seed': seed,
+            'repeat': repeat,
+        },
+        'peak_rss_mb': peak_rss_mb(),
+        'results': results,
+    }
+
+def compare_to_baseline(report, baseline, threshold=0.1):
+    # Prints the p50 change of every stage and size found in both runs; returns the ones that got slower than threshold
+    regressions = []
+    print(f"\n{'stage':<16} {'lines':>7} {'baseline ms':>12} {'now ms':>12} {'change':>8}")
+    for stage, sizes in report['results'].items():
+        for size, entry in sizes.items():
+            old = baseline.get('results', {}).get(stage, {}).get(size)
+            if not old:
+                continue
+            change = entry['p50_ms'] / old['p50_ms'] - 1 if old['p50_ms'] else 0.0
+            flag = '  slower' if change > threshold else ''
+            if flag:
+                regressions.append((stage, size, change))
+            print(f"{stage:<16} {size:>7} {old['p50_ms']:>12.2f} {entry['p50_ms']:>12.2f} {change:>+8.1%}{flag}")
+    return regressions
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Micro-benchmarks for the conversion pipeline')
+    parser.add_argument('suite', choices=['tokenizer', 'rules', 'classes', 'full'])
+    parser.add_argument('--input', default=None, help='C++ file to benchmark on (defaults to a small built-in sample)')
+    parser.add_argument('--repeat', type=int, default=None)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000, 100000], help='corpus sizes in lines (full suite)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help='JSON file to write the full suite results to')
+    parser.add_argument('--baseline', default=None, help='earlier --output file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1, help='p50 slowdown that counts as a regression')
+    parser.add_argument('--checkpoint', default=None)
+    parser.add_argument('--random-weights', action='store_true', help='time the model stages with untrained weights (no checkpoint needed)')
+    parser.add_argument('--no-model', action='store_true', help='skip the encode and decode stages')
+    parser.add_argument('--model-lines', type=int, default=256, help='lines of each corpus fed to the model stages')
+    args = parser.parse_args()
+
+    lines = SAMPLE_LINES
+    if args.input:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            lines = f.read().split('\n')
+    if args.suite == 'tokenizer':
+        bench_tokenizer(lines, args.repeat or 2000)
+    elif args.suite == 'rules':
+        bench_rules(lines, args.repeat or 200)
+    elif args.suite == 'classes':
+        bench_classes(repeat=args.repeat or 3)
+    elif args.suite == 'full':
+        model, model_label = None, None
+        if args.random_weights:
+            from SASTRA_Code_Converter_DL import get_model
+            model, model_label = get_model(config), 'random weights'
+        elif not args.no_model:
+            import model_registry
+            model = model_registry.load_model(args.checkpoint)
+            model_label = model_registry.checkpoint_tag(args.checkpoint or model_registry.checkpoint_path())
+        report = bench_full(args.sizes, args.repeat or 5, model, model_label, args.seed, args.model_lines)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            print(f"Results written to {args.output}")
+        if args.baseline:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                regressions = compare_to_baseline(report, json.load(f), args.threshold)
+            if regressions:
+                sys.exit(1)
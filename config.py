@@ -8,5 +8,13 @@ def get_config():
         "lr": 10**-4,
         "seq_len": 64,
         "d_model": 1024,
+        "infer_batch_size": 32,
+        "infer_bucket_window": 8, # Lines are sorted by length within this many batches, each batch is padded to its longest line
+        "decode_strategy": "greedy", # or "beam"
+        "beam_size": 4,
+        "length_penalty": 0.6, # Beam scores are divided by length ** length_penalty
+        "length_ratio": None, # e.g. 2.0: outputs stop at length_ratio * source tokens + length_margin (and seq_len), None: only seq_len
+        "length_margin": 8,
+        "autocast_dtype": None, # "bfloat16" runs the model under CPU autocast, see model.autocast
     }
 
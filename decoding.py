@@ -0,0 +1,157 @@
+#This module holds the decoding loops used at inference time to turn the encoder output into Rust token ids.
+import time
+import torch
+import metrics
+from model import autocast
+
+def causal_mask(size):
+    mask = torch.triu(torch.ones((1, size, size)), diagonal=1).type(torch.int)
+    return mask == 0
+
+def greedy_decode(model, source, source_mask, sos_id, eos_id, max_len):
+    # Reference loop: runs the decoder over the whole prefix again for every new token
+    encoder_output = model.encode(source, source_mask)
+    decoder_input = torch.empty(1, 1).fill_(sos_id).type_as(source)
+
+    while True:
+        if decoder_input.size(1) == max_len:
+            break
+
+        # Build mask for target
+        decoder_mask = causal_mask(decoder_input.size(1)).type_as(source_mask)
+
+        # Calculate output
+        out = model.decode(encoder_output, source_mask, decoder_input, decoder_mask)
+
+        # Get next token
+        prob = model.project(out[:, -1])
+        _, next_word = torch.max(prob, dim=1)
+        decoder_input = torch.cat(
+            [decoder_input, torch.empty(1, 1).type_as(source).fill_(next_word.item())], dim=1
+        )
+        if next_word == eos_id:  # End token
+            break
+
+    return decoder_input.tolist()[0]
+
+def output_limits(source_mask, max_len, ratio=None, margin=None):
+    # Longest output (in tokens, [SOS] included) allowed for every row, from the number of real tokens in its source.
+    # A Rust line is rarely more than twice as long as the C++ line it comes from, so this stops runaway decodes
+    # long before seq_len. ratio=None keeps the fixed max_len limit
+    # The mask also covers the source's own [SOS] and [EOS], they don't count towards its length
+    count = torch.clamp(source_mask.reshape(source_mask.shape[0], -1).sum(dim=1) - 2, min=0)
+    if ratio is None:
+        return torch.full_like(count, max_len)
+    return torch.clamp(torch.ceil(count * ratio).long() + (margin or 0), max=max_len)
+
+def greedy_decode_batch(model, source, source_mask, sos_id, eos_id, max_len, limits=None, check_every=4):
+    # source: (batch, seq_len), source_mask: (batch, 1, 1, seq_len), limits: (batch,) longest output of every row
+    # Decodes every row together with cached keys/values. Whether rows are done is only tracked on tensors;
+    # every check_every steps the finished rows leave the batch, and the loop stops once none is left
+    batch = source.shape[0]
+    with metrics.timed('encode'):
+        encoder_output = model.encode(source, source_mask)
+        cache = model.init_decode_cache(encoder_output, max_len)
+    decoder_input = torch.full((batch, max_len), sos_id, dtype=source.dtype)
+    decode_start = time.perf_counter()
+    limits = torch.full((batch,), max_len) if limits is None else limits
+    lengths = limits.clone() # A row that never emits [EOS] runs up to its limit
+    finished = torch.zeros(batch, dtype=torch.bool)
+    active = torch.arange(batch) # Original row of every sequence still in the batch
+    steps = int(limits.max())
+
+    length = 1
+    while length < steps:
+        out = model.decode_step(source_mask, decoder_input[active, length - 1:length], cache)
+        prob = model.project(out[:, -1])
+        _, next_word = torch.max(prob, dim=1)
+        decoder_input[active, length] = next_word
+        length += 1
+
+        was_finished = finished[active]
+        ended = (next_word == eos_id) & ~was_finished  # End token
+        lengths[active] = torch.where(ended, length, lengths[active])
+        finished[active] = was_finished | ended | (limits[active] <= length)
+
+        if length % check_every == 0 or length == steps:
+            keep = (~finished[active]).nonzero(as_tuple=True)[0]
+            if keep.numel() == 0:
+                break
+            if keep.numel() < active.numel():
+                active = active[keep]
+                cache = cache.index_select(keep)
+                source_mask = source_mask.index_select(0, keep)
+    metrics.observe_stage('decode', time.perf_counter() - decode_start)
+
+    lengths = lengths.tolist()
+    return [row[:lengths[i]] for i, row in enumerate(decoder_input.tolist())]
+
+def beam_search_batch(model, source, source_mask, sos_id, eos_id, max_len, beam_size=4, limits=None, length_penalty=0.6, check_every=4):
+    # Same inputs and output as greedy_decode_batch: the best of beam_size hypotheses for every source row.
+    # Row b * beam_size + k of the decode batch is beam k of source b
+    batch = source.shape[0]
+    rows = batch * beam_size
+    with metrics.timed('encode'):
+        encoder_output = model.encode(source, source_mask)
+        cache = model.init_decode_cache(encoder_output, max_len)
+        expand = torch.arange(batch).repeat_interleave(beam_size)
+        cache = cache.index_select(expand)
+        source_mask = source_mask.index_select(0, expand)
+    decode_start = time.perf_counter()
+    limits = torch.full((batch,), max_len) if limits is None else limits
+    limits = limits.repeat_interleave(beam_size)
+    tokens = torch.full((rows, max_len), sos_id, dtype=source.dtype)
+    lengths = limits.clone()
+    finished = torch.zeros(rows, dtype=torch.bool)
+    # Every beam starts as the same [SOS], only the first one is live so the first step doesn't pick duplicates
+    scores = torch.full((batch, beam_size), float('-inf'))
+    scores[:, 0] = 0.0
+    first_beam = (torch.arange(batch) * beam_size).unsqueeze(1)
+    eos_only = None
+    steps = int(limits.max())
+
+    length = 1
+    while length < steps:
+        out = model.decode_step(source_mask, tokens[:, length - 1:length], cache)
+        log_probs = torch.log_softmax(model.project(out[:, -1]).float(), dim=-1)
+        vocab_size = log_probs.shape[1]
+        if eos_only is None:
+            eos_only = torch.full((1, vocab_size), float('-inf'))
+            eos_only[0, eos_id] = 0.0
+        # A finished hypothesis can only be extended by [EOS], at no cost, so it keeps its score and its place
+        log_probs = torch.where(finished.unsqueeze(1), eos_only, log_probs)
+
+        candidates = (scores.reshape(rows, 1) + log_probs).reshape(batch, beam_size * vocab_size)
+        scores, index = candidates.topk(beam_size, dim=1)
+        parent = (first_beam + torch.div(index, vocab_size, rounding_mode='floor')).reshape(rows)
+        next_word = (index % vocab_size).reshape(rows)
+
+        tokens = tokens.index_select(0, parent)
+        tokens[:, length] = next_word
+        cache = cache.reorder_beams(parent)
+        was_finished = finished.index_select(0, parent)
+        lengths = lengths.index_select(0, parent)
+        length += 1
+
+        ended = (next_word == eos_id) & ~was_finished
+        lengths = torch.where(ended, length, lengths)
+        finished = was_finished | ended | (limits <= length)
+        if (length % check_every == 0 or length == steps) and bool(finished.all()):
+            break
+    metrics.observe_stage('decode', time.perf_counter() - decode_start)
+
+    # Longer hypotheses collect more negative log-probabilities, the penalty keeps beam search from preferring short ones
+    normalized = scores / lengths.reshape(batch, beam_size).float() ** length_penalty
+    best = first_beam.squeeze(1) + normalized.argmax(dim=1)
+    lengths = lengths.index_select(0, best).tolist()
+    return [row[:lengths[i]] for i, row in enumerate(tokens.index_select(0, best).tolist())]
+
+def decode_batch(model, source, source_mask, sos_id, eos_id, max_len, config):
+    # Picks the decoder and output length limits from the config (decode_strategy, beam_size, length_ratio, length_margin)
+    # and the precision (autocast_dtype)
+    limits = output_limits(source_mask, max_len, config.get('length_ratio'), config.get('length_margin'))
+    # One autocast region for the whole batch, so every weight is cast to bf16 once instead of on every step
+    with autocast(config.get('autocast_dtype')):
+        if config.get('decode_strategy', 'greedy') == 'beam' and config.get('beam_size', 1) > 1:
+            return beam_search_batch(model, source, source_mask, sos_id, eos_id, max_len, config['beam_size'], limits, config.get('length_penalty', 0.6))
+        return greedy_decode_batch(model, source, source_mask, sos_id, eos_id, max_len, limits)
@@ -0,0 +1,210 @@
+#This module exports the trained transformer to TorchScript, so inference runs a traced graph instead of the Python
+#object graph of model.py (lambdas in the residual connections, Python loops over the layers).
+#The exported module has the methods encode, init_cache, decode_step and project; ExportedModel wraps it in the
+#interface decoding.py expects from a Transformer, and model_registry loads it when SASTRA_EXPORTED=1.
+#Export and parity check: python export.py [--checkpoint file.pth] [--output file.ts] [--quantize]
+import argparse
+import json
+import os
+import time
+import torch
+import torch.nn as nn
+from model import DecodeCache
+
+EXPORT_VERSION = 2
+
+class InferenceGraph(nn.Module):
+    # The inference paths of a Transformer written with tensor positions only, so tracing doesn't bake
+    # the decode position into the graph. The weights are the model's own submodules
+
+    def __init__(self, model, max_len: int) -> None:
+        super().__init__()
+        self.model = model
+        self.register_buffer('positions', torch.arange(max_len), persistent=False)
+
+    def encode(self, src, src_mask):
+        return self.model.encode(src, src_mask)
+
+    def init_cache(self, encoder_output):
+        # Cross-attention keys/values of every decoder layer, computed once per source
+        keys, values = [], []
+        for layer in self.model.decoder.layers:
+            key, value = layer.cross_attention_block.project_kv(encoder_output, encoder_output)
+            keys.append(key)
+            values.append(value)
+        return tuple(keys), tuple(values)
+
+    def decode_step(self, src_mask, tgt, position, self_keys, self_values, cross_keys, cross_values):
+        # Same as Transformer.decode_step, except that the cache tensors are passed in and position is a tensor:
+        # the new key/value is written in place at position, and attention covers the whole buffer with the
+        # positions after it masked out (instead of slicing the buffer down to position + 1)
+        x = self.model.tgt_embed(tgt)
+        x = x + self.model.tgt_pos.pe.index_select(1, position.view(1))
+        index = position.view(1)
+        visible = (self.positions <= position).view(1, 1, 1, -1)
+        for i, layer in enumerate(self.model.decoder.layers):
+            attention = layer.self_attention_block
+
+            def self_attention(x):
+                key, value = attention.project_kv(x, x)
+                # Under bf16 autocast the projections come out in bf16, the cache stays fp32
+                self_keys[i].index_copy_(2, index, key.to(self_keys[i].dtype))
+                self_values[i].index_copy_(2, index, value.to(self_values[i].dtype))
+                return attention.attend(x, self_keys[i], self_values[i], visible)
+
+            x = layer.residual_connections[0](x, self_attention)
+            x = layer.residual_connections[1](x, lambda x: layer.cross_attention_block.attend(x, cross_keys[i], cross_values[i], src_mask))
+            x = layer.residual_connections[2](x, layer.feed_forward_block)
+        return self.model.decoder.norm(x)
+
+    def project(self, x):
+        return self.model.project(x)
+
+def example_inputs(model, max_len, batch=2):
+    layer = model.decoder.layers[0].self_attention_block
+    src = torch.ones(batch, max_len, dtype=torch.long)
+    src_mask = torch.ones(batch, 1, 1, max_len, dtype=torch.int)
+    encoder_output = model.encode(src, src_mask)
+    cross_keys, cross_values = InferenceGraph(model, max_len).init_cache(encoder_output)
+    self_keys = tuple(encoder_output.new_zeros(batch, layer.h, max_len, layer.d_k) for _ in model.decoder.layers)
+    self_values = tuple(encoder_output.new_zeros(batch, layer.h, max_len, layer.d_k) for _ in model.decoder.layers)
+    tgt = torch.ones(batch, 1, dtype=torch.long)
+    return {
+        'encode': (src, src_mask),
+        'init_cache': (encoder_output,),
+        'decode_step': (src_mask, tgt, torch.tensor(0), self_keys, self_values, cross_keys, cross_values),
+        'project': (encoder_output[:, :1],),
+    }
+
+def export_model(model, output_path, max_len, tag=None, quantized=False):
+    model.eval()
+    layer = model.decoder.layers[0].self_attention_block
+    graph = InferenceGraph(model, max_len).eval()
+    with torch.no_grad():
+        traced = torch.jit.trace_module(graph, example_inputs(model, max_len), check_trace=False)
+    meta = {
+        'version': EXPORT_VERSION,
+        'tag': tag, # Checkpoint the weights come from, see model_registry.checkpoint_tag
+        'quantized': quantized,
+        'max_len': max_len,
+        'layers': len(model.decoder.layers),
+        'heads': layer.h,
+        'd_k': layer.d_k,
+    }
+    tmp_path = output_path + '.tmp'
+    torch.jit.save(traced, tmp_path, _extra_files={'meta.json': json.dumps(meta)})
+    os.replace(tmp_path, output_path)
+    return meta
+
+def read_meta(path):
+    extra_files = {'meta.json': ''}
+    module = torch.jit.load(path, map_location='cpu', _extra_files=extra_files)
+    return module, json.loads(extra_files['meta.json'])
+
+class ExportedModel:
+    # Stands in for a Transformer wherever decoding.py runs one (encode, init_decode_cache, decode_step, project)
+
+    def __init__(self, module, meta) -> None:
+        self.module = module
+        self.meta = meta
+
+    @classmethod
+    def load(cls, path, tag=None, quantized=False):
+        # Returns None when the file is missing or was exported from another checkpoint
+        if not os.path.exists(path):
+            return None
+        module, meta = read_meta(path)
+        if meta.get('version') != EXPORT_VERSION or meta.get('tag') != tag or meta.get('quantized', False) != quantized:
+            return None
+        return cls(module.eval(), meta)
+
+    def eval(self):
+        return self
+
+    def encode(self, src, src_mask):
+        return self.module.encode(src, src_mask)
+
+    def init_decode_cache(self, encoder_output, max_len):
+        if max_len != self.meta['max_len']:
+            raise ValueError(f"The exported model decodes up to {self.meta['max_len']} tokens, not {max_len}")
+        batch = encoder_output.shape[0]
+        shape = (batch, self.meta['heads'], max_len, self.meta['d_k'])
+        cross_keys, cross_values = self.module.init_cache(encoder_output)
+        self_keys = [encoder_output.new_zeros(shape) for _ in range(self.meta['layers'])]
+        self_values = [encoder_output.new_zeros(shape) for _ in range(self.meta['layers'])]
+        return DecodeCache(self_keys, self_values, list(cross_keys), list(cross_values))
+
+    def decode_step(self, src_mask, tgt, cache):
+        x = self.module.decode_step(src_mask, tgt, torch.tensor(cache.length), tuple(cache.self_keys), tuple(cache.self_values),
+                                    tuple(cache.cross_keys), tuple(cache.cross_values))
+        cache.length += 1
+        return x
+
+    def project(self, x):
+        return self.module.project(x)
+
+    def decode(self, encoder_output, src_mask, tgt, tgt_mask):
+        # The uncached loop (greedy_decode) runs the whole prefix again on every step, the export only has the
+        # cached step: replay the prefix one position at a time (each step already sees only what came before it)
+        cache = self.init_decode_cache(encoder_output, self.meta['max_len'])
+        return torch.cat([self.decode_step(src_mask, tgt[:, i:i + 1], cache) for i in range(tgt.shape[1])], dim=1)
+
+def parity_report(eager_model, exported_model, cpp_lines):
+    # Logit differences on one decode, and how often both models translate a line the same way
+    from SASTRA_Code_Converter_DL import Validate, config, rust_vocabulary_1
+    from benchmark import model_inputs, model_line_agreement
+
+    cpp_lines = '\n'.join(cpp_lines).strip().split('\n') # The lines as Validate sees them
+    source, source_mask = model_inputs(cpp_lines)
+    max_len = config['seq_len']
+    with torch.no_grad():
+        outputs = []
+        for model in (eager_model, exported_model):
+            cache = model.init_decode_cache(model.encode(source, source_mask), max_len)
+            token = torch.full((source.shape[0], 1), rust_vocabulary_1.get('[SOS]'), dtype=source.dtype)
+            logits = []
+            for _ in range(8):
+                logits.append(model.project(model.decode_step(source_mask, token, cache)[:, -1]))
+                token = logits[-1].argmax(dim=1, keepdim=True)
+            outputs.append(torch.stack(logits))
+    results = {}
+    for label, model in (('eager', eager_model), ('exported', exported_model)):
+        start = time.perf_counter()
+        results[label] = Validate(model, '\n'.join(cpp_lines), validate=False).split('\n')
+        results[label + '_seconds'] = time.perf_counter() - start
+    report = {
+        'lines': len(cpp_lines),
+        'max_abs_logit_diff': float((outputs[0] - outputs[1]).abs().max()),
+    }
+    report.update(model_line_agreement(cpp_lines, results['eager'], results['exported']))
+    report.update({
+        'eager_seconds': results['eager_seconds'],
+        'exported_seconds': results['exported_seconds'],
+    })
+    return report
+
+if __name__ == '__main__':
+    import model_registry
+    from benchmark import SAMPLE_LINES
+    from SASTRA_Code_Converter_DL import config
+
+    parser = argparse.ArgumentParser(description='Export the trained transformer to TorchScript and check it against the eager model')
+    parser.add_argument('--checkpoint', default=None)
+    parser.add_argument('--output', default=None, help='defaults to the checkpoint path with a .ts extension')
+    parser.add_argument('--quantize', action='store_true', help='export the int8 model')
+    parser.add_argument('--input', default=None, help='C++ file for the parity check (defaults to a small built-in sample)')
+    args = parser.parse_args()
+
+    model_path = args.checkpoint or model_registry.checkpoint_path()
+    output_path = args.output or model_registry.exported_path(model_path)
+    eager_model = model_registry.load_model(model_path, args.quantize)
+    start = time.perf_counter()
+    export_model(eager_model, output_path, config['seq_len'], model_registry.checkpoint_tag(model_path), args.quantize)
+    print(f"Exported to {output_path} in {time.perf_counter() - start:.1f}s")
+
+    cpp_lines = SAMPLE_LINES
+    if args.input:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            cpp_lines = [line for line in f.read().split('\n') if line.strip()]
+    exported_model = ExportedModel.load(output_path, model_registry.checkpoint_tag(model_path), args.quantize)
+    print(json.dumps(parity_report(eager_model, exported_model, cpp_lines), indent=2))
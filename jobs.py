@@ -0,0 +1,161 @@
+#Background jobs for the backend. A conversion submitted as a job runs on a small pool of worker threads instead of
+#the request thread, so one large file doesn't block the other requests (or the /ping health check) while the model works.
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import metrics
+
+class QueueFull(Exception):
+    pass
+
+class JobCancelled(Exception):
+    pass
+
+class Job:
+
+    def __init__(self, kind, target) -> None:
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.target = target # Called with the job, returns the result dict
+        self.status = 'queued' # queued --> running --> done / failed / cancelled
+        self.result = None
+        self.error = None
+        self.done = 0 # Progress in lines, total stays None when it isn't known up front
+        self.total = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.future = None
+        self._cancel = threading.Event()
+
+    @property
+    def is_finished(self):
+        return self.status in ('done', 'failed', 'cancelled')
+
+    def cancel(self):
+        self._cancel.set()
+
+    def check_cancelled(self):
+        # Long running jobs call this between chunks of work, a cancelled job stops at the next one
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def timing(self):
+        now = time.time()
+        return {
+            'queued_seconds': (self.started or self.finished or now) - self.created,
+            'run_seconds': ((self.finished or now) - self.started) if self.started else 0.0,
+            'total_seconds': (self.finished or now) - self.created,
+        }
+
+    def to_dict(self):
+        data = {
+            'id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'done': self.done,
+            'total': self.total,
+            'timing': self.timing(),
+        }
+        if self.status == 'done':
+            data['result'] = self.result
+        elif self.status == 'failed':
+            data['error'] = self.error
+        return data
+
+class JobQueue:
+
+    def __init__(self, workers: int=2, max_queued: int=16, keep_finished: int=100) -> None:
+        self.workers = workers
+        self.max_queued = max_queued # Jobs waiting for a worker, submit refuses more than this
+        self.keep_finished = keep_finished # Finished jobs stay around for this many more jobs so clients can fetch them
+        self._jobs = OrderedDict() # id --> Job, oldest first
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='job')
+
+    def _count(self, status):
+        return sum(job.status == status for job in self._jobs.values())
+
+    def _update_gauges(self):
+        # Called with the lock held after every status change
+        for status in ('queued', 'running'):
+            metrics.set_gauge('sastra_jobs_active', self._count(status), status=status)
+
+    def submit(self, kind, target):
+        with self._lock:
+            if self._count('queued') >= self.max_queued:
+                raise QueueFull(f"{self.max_queued} jobs are already waiting")
+            job = Job(kind, target)
+            self._jobs[job.id] = job
+            self._forget_finished()
+            job.future = self._executor.submit(self._run, job)
+            self._update_gauges()
+        return job
+
+    def _forget_finished(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+        for job_id in finished[:max(0, len(finished) - self.keep_finished)]:
+            del self._jobs[job_id]
+
+    def _run(self, job):
+        with self._lock:
+            if job.status != 'queued': # Cancelled while it was waiting
+                return
+            job.status = 'running'
+            job.started = time.time()
+            self._update_gauges()
+        try:
+            job.check_cancelled()
+            result = job.target(job)
+            status, job.result = 'done', result
+        except JobCancelled:
+            status = 'cancelled'
+        except Exception as e:
+            print(f"[ERROR] {job.kind} job {job.id} failed: {e}")
+            metrics.inc('sastra_errors_total', endpoint='jobs')
+            status, job.error = 'failed', str(e)
+        with self._lock:
+            job.finished = time.time()
+            job.status = status
+            self._update_gauges()
+        metrics.observe_latency('sastra_job_wait_seconds', job.started - job.created, kind=job.kind)
+        metrics.observe_latency('sastra_job_seconds', job.finished - job.started, kind=job.kind)
+        metrics.inc('sastra_jobs_total', kind=job.kind, status=status)
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        # A queued job is dropped right away, a running one stops at its next check_cancelled
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.is_finished:
+                return job
+            job.cancel()
+            if job.status != 'queued':
+                return job
+            job.future.cancel()
+            job.status = 'cancelled'
+            job.finished = time.time()
+            self._update_gauges()
+        # It never ran: all its time was spent waiting
+        metrics.observe_latency('sastra_job_wait_seconds', job.finished - job.created, kind=job.kind)
+        metrics.inc('sastra_jobs_total', kind=job.kind, status='cancelled')
+        return job
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'max_queued': self.max_queued,
+                'queued': self._count('queued'),
+                'running': self._count('running'),
+            }
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            for job in self._jobs.values():
+                job.cancel()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
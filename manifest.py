@@ -0,0 +1,116 @@
+#This module remembers what an earlier conversion of a source tree produced, so a re-run only translates what changed.
+#Every input file is stored with the sha256 of its content and of the output written for it. In ai mode each file also keeps
+#the translation of its lines by line hash, so an edited file only sends its edited lines through the model.
+#The whole manifest is dropped when the converter code or the model checkpoint changes.
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = '.sastra_manifest.json'
+MANIFEST_VERSION = 1
+
+# Bump to invalidate every manifest by hand, the module sources below are hashed in as well
+CONVERTER_VERSION = 1
+CONVERTER_MODULES = {
+    'rule': ('sastra.py',),
+    'ai': ('SASTRA_Code_Converter_DL.py', 'decoding.py', 'model.py', 'config.py'),
+}
+
+def text_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def converter_version(mode):
+    # Editing a rule or the decoding code changes the output, so it changes the version too
+    # (a frozen build has no sources next to it and only goes by CONVERTER_VERSION)
+    digest = hashlib.sha256(f"{CONVERTER_VERSION}:{mode}".encode('utf-8'))
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    for name in CONVERTER_MODULES[mode]:
+        path = os.path.join(base_path, name)
+        if os.path.exists(path):
+            digest.update(file_hash(path).encode('utf-8'))
+    return digest.hexdigest()
+
+class Manifest:
+
+    def __init__(self, path, mode, checkpoint=None, checkpoint_tag=None, quantized=False) -> None:
+        self.path = path
+        self.mode = mode
+        self.quantized = quantized # int8 translations differ from fp32 ones
+        self.converter = converter_version(mode)
+        self.files = {} # Relative source path --> {'source', 'output', 'output_hash', 'lines'}
+        data = self._read()
+
+        # Hashing a large checkpoint takes a while, so the hash is reused while its size and mtime stay the same
+        self.checkpoint_tag = checkpoint_tag
+        self.checkpoint = None
+        if checkpoint:
+            if checkpoint_tag and data.get('checkpoint_tag') == checkpoint_tag:
+                self.checkpoint = data.get('checkpoint')
+            else:
+                self.checkpoint = file_hash(checkpoint)
+
+        if (data.get('version') == MANIFEST_VERSION and data.get('mode') == mode and data.get('quantized', False) == quantized
+                and data.get('converter') == self.converter and data.get('checkpoint') == self.checkpoint):
+            self.files = data.get('files', {})
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Could not load manifest {self.path}: {e}")
+            return {}
+
+    def unchanged(self, key, source_hash, output_key, output_path):
+        # True when the source is the one converted last time and its output is still on disk untouched
+        entry = self.files.get(key)
+        if entry is None or entry['source'] != source_hash or entry['output'] != output_key:
+            return False
+        return os.path.exists(output_path) and file_hash(output_path) == entry['output_hash']
+
+    def line_outputs(self, key):
+        # Line hash --> Rust line from the last conversion of this file (ai mode)
+        entry = self.files.get(key)
+        return entry.get('lines', {}) if entry else {}
+
+    def record(self, key, source_hash, output_key, output_hash, lines=None):
+        entry = {'source': source_hash, 'output': output_key, 'output_hash': output_hash}
+        if lines:
+            entry['lines'] = lines
+        self.files[key] = entry
+
+    def forget(self, key):
+        self.files.pop(key, None)
+
+    def prune(self, keys):
+        # Drops the files that are no longer part of the tree
+        keys = set(keys)
+        for key in [key for key in self.files if key not in keys]:
+            del self.files[key]
+
+    def save(self, path=None):
+        path = path or self.path
+        data = {
+            'version': MANIFEST_VERSION,
+            'mode': self.mode,
+            'quantized': self.quantized,
+            'converter': self.converter,
+            'checkpoint': self.checkpoint,
+            'checkpoint_tag': self.checkpoint_tag,
+            'files': self.files,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Write to a temporary file first so a crash never leaves a half written manifest behind
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
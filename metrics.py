@@ -0,0 +1,164 @@
+#Lightweight in-process metrics: counters, per-stage timings and request latency histograms, rendered in the
+#Prometheus text format by the backend's /metrics route. No client library needed.
+#Stage timings are also added to the breakdown of the current request (see breakdown()), so a single slow
+#conversion can report where its own time went.
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+HELP = {
+    'sastra_stage_seconds': ('summary', 'Time spent in each conversion stage'),
+    'sastra_request_seconds': ('histogram', 'Backend request latency'),
+    'sastra_requests_total': ('counter', 'Backend requests by endpoint and status'),
+    'sastra_errors_total': ('counter', 'Failed conversions by endpoint'),
+    'sastra_lines_total': ('counter', 'AI converted lines by how they were translated'),
+    'sastra_tokens_total': ('counter', 'Tokens fed to and decoded by the model'),
+    'sastra_cache_lookups_total': ('counter', 'Translation cache lookups by result'),
+    'sastra_model_loaded': ('gauge', 'Whether the AI model is loaded'),
+    'sastra_jobs_total': ('counter', 'Finished background jobs by kind and status'),
+    'sastra_job_seconds': ('histogram', 'Background job run time'),
+    'sastra_job_wait_seconds': ('histogram', 'Time background jobs spent queued'),
+    'sastra_jobs_active': ('gauge', 'Background jobs waiting for a worker or running'),
+    'sastra_jobs_workers': ('gauge', 'Worker threads of the job queue'),
+    'sastra_jobs_max_queued': ('gauge', 'Jobs that can wait for a worker before submits are refused'),
+    'sastra_translation_cache_entries': ('gauge', 'Lines in the translation cache'),
+    'sastra_translation_cache_capacity': ('gauge', 'Most lines the translation cache keeps'),
+}
+
+_lock = threading.Lock()
+_counters = {} # (name, labels) --> value
+_summaries = {} # (name, labels) --> [count, sum]
+_histograms = {} # (name, labels) --> [bucket counts..., count, sum]
+_gauges = {} # (name, labels) --> value
+_local = threading.local()
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+def inc(name, value=1, **labels):
+    if not value:
+        return
+    with _lock:
+        key = _key(name, labels)
+        _counters[key] = _counters.get(key, 0) + value
+
+def set_gauge(name, value, **labels):
+    with _lock:
+        _gauges[_key(name, labels)] = value
+
+def observe_stage(stage, seconds):
+    # Adds to the process wide totals and to the breakdown of the request running on this thread
+    with _lock:
+        entry = _summaries.setdefault(_key('sastra_stage_seconds', {'stage': stage}), [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+    current = getattr(_local, 'breakdown', None)
+    if current is not None:
+        current[stage] = current.get(stage, 0.0) + seconds
+
+def observe_latency(name, seconds, **labels):
+    with _lock:
+        entry = _histograms.setdefault(_key(name, labels), [0] * len(LATENCY_BUCKETS) + [0, 0.0])
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                entry[i] += 1
+        entry[-2] += 1
+        entry[-1] += seconds
+
+@contextmanager
+def timed(stage):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start)
+
+def timed_iter(stage, iterator):
+    # Times a generator while it works, leaving out the time its consumer holds on to each item.
+    # Recorded once it is exhausted (or closed early by a consumer that gave up on it)
+    iterator = iter(iterator)
+    seconds = 0.0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                seconds += time.perf_counter() - start
+            yield item
+    finally:
+        observe_stage(stage, seconds)
+
+def timed_generator(stage):
+    # Decorator form of timed_iter for generator functions (timed() works as a decorator for plain ones)
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            return timed_iter(stage, function(*args, **kwargs))
+        return wrapper
+    return decorate
+
+@contextmanager
+def breakdown():
+    # Collects {stage: seconds} for everything timed on this thread inside the block
+    previous = getattr(_local, 'breakdown', None)
+    _local.breakdown = {}
+    try:
+        yield _local.breakdown
+    finally:
+        _local.breakdown = previous
+
+def _format_labels(labels, extra=()):
+    labels = list(labels) + list(extra)
+    if not labels:
+        return ''
+    values = ','.join('{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')) for name, value in labels)
+    return '{' + values + '}'
+
+def render():
+    # Prometheus text exposition format, version 0.0.4
+    with _lock:
+        counters, summaries = dict(_counters), {key: list(value) for key, value in _summaries.items()}
+        histograms, gauges = {key: list(value) for key, value in _histograms.items()}, dict(_gauges)
+
+    lines = []
+    described = set()
+
+    def describe(name, kind):
+        if name in described:
+            return
+        described.add(name)
+        help_text = HELP.get(name, (kind, name))[1]
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    for (name, labels), value in sorted(counters.items()):
+        describe(name, 'counter')
+        lines.append(f"{name}{_format_labels(labels)} {value}")
+    for (name, labels), value in sorted(gauges.items()):
+        describe(name, 'gauge')
+        lines.append(f"{name}{_format_labels(labels)} {value}")
+    for (name, labels), (count, total) in sorted(summaries.items()):
+        describe(name, 'summary')
+        lines.append(f"{name}_count{_format_labels(labels)} {count}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+    for (name, labels), entry in sorted(histograms.items()):
+        describe(name, 'histogram')
+        for bound, count in zip(LATENCY_BUCKETS, entry):
+            lines.append(f"{name}_bucket{_format_labels(labels, [('le', bound)])} {count}")
+        lines.append(f"{name}_bucket{_format_labels(labels, [('le', '+Inf')])} {entry[-2]}")
+        lines.append(f"{name}_count{_format_labels(labels)} {entry[-2]}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {entry[-1]}")
+    return '\n'.join(lines) + '\n'
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _summaries.clear()
+        _histograms.clear()
+        _gauges.clear()
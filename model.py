@@ -1,9 +1,18 @@
 #This program is where the transformer model is built from scratch. Each and every block in this file is built, in reference with the research paper "Attention is all you Need", and a youtube video to build transfromer model from scratch, link given below.
 #Youtube Link: https://www.youtube.com/watch?v=ISNdQcPhsts
+import contextlib
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import math
 
+def autocast(dtype=None):
+    # Mixed precision on CPU for inference and training: with dtype 'bfloat16' the matmuls run in bf16,
+    # LayerNormalization and the residual stream stay in fp32. None (or 'float32') runs everything in fp32
+    if dtype in (None, 'float32'):
+        return contextlib.nullcontext()
+    return torch.autocast('cpu', dtype=getattr(torch, dtype))
+
 class LayerNormalization(nn.Module):
 
     def __init__(self, features: int, eps:float=10**-6) -> None:
@@ -14,12 +23,11 @@ class LayerNormalization(nn.Module):
 
     def forward(self, x):
         # x: (batch, seq_len, hidden_size)
-         # Keep the dimension for broadcasting
-        mean = x.mean(dim = -1, keepdim = True) # (batch, seq_len, 1)
-        # Keep the dimension for broadcasting
-        std = x.std(dim = -1, keepdim = True) # (batch, seq_len, 1)
+        # Mean and (unbiased) variance in one reduction, always in fp32 so a bf16 input doesn't lose the small differences
+        var, mean = torch.var_mean(x.float(), dim = -1, keepdim = True) # (batch, seq_len, 1)
         # eps is to prevent dividing by zero or when std is very small
-        return self.alpha * (x - mean) / (std + self.eps) + self.bias
+        # It is added to the std rather than the variance, which is why this isn't nn.LayerNorm
+        return self.alpha * (x - mean) / (var.sqrt() + self.eps) + self.bias
 
 class FeedForwardBlock(nn.Module):
 
@@ -68,8 +76,9 @@ class PositionalEncoding(nn.Module):
         # Register the positional encoding as a buffer
         self.register_buffer('pe', pe)
 
-    def forward(self, x):
-        x = x + (self.pe[:, :x.shape[1], :]).requires_grad_(False) # (batch, seq_len, d_model)
+    def forward(self, x, offset: int=0):
+        # offset is the position of the first element of x, used when decoding one token at a time
+        x = x + (self.pe[:, offset:offset + x.shape[1], :]).requires_grad_(False) # (batch, seq_len, d_model)
         return self.dropout(x)
 
 class ResidualConnection(nn.Module):
@@ -97,6 +106,9 @@ class MultiHeadAttentionBlock(nn.Module):
         self.w_v = nn.Linear(d_model, d_model, bias=False) # Wv
         self.w_o = nn.Linear(d_model, d_model, bias=False) # Wo
         self.dropout = nn.Dropout(dropout)
+        # Keeping the (batch, h, seq_len, seq_len) scores is only needed for visualization, see Transformer.enable_attention_scores
+        self.store_attention_scores = False
+        self.attention_scores = None
 
     @staticmethod
     def attention(query, key, value, mask, dropout: nn.Dropout):
@@ -114,6 +126,21 @@ class MultiHeadAttentionBlock(nn.Module):
         # return attention scores which can be used for visualization
         return (attention_scores @ value), attention_scores
 
+    @staticmethod
+    def fused_attention(query, key, value, mask, dropout_p: float=0.0):
+        # Same result as attention(), but PyTorch's fused kernel never materialises the score tensor
+        # The masks from the tokenizers are 1 where attention is allowed, masked positions get -1e9 like in attention()
+        attn_mask = None
+        if mask is not None:
+            attn_mask = torch.zeros(mask.shape, dtype=query.dtype, device=query.device).masked_fill_(mask == 0, -1e9)
+        return F.scaled_dot_product_attention(query, key, value, attn_mask=attn_mask, dropout_p=dropout_p)
+
+    def compute_attention(self, query, key, value, mask):
+        if self.store_attention_scores:
+            x, self.attention_scores = MultiHeadAttentionBlock.attention(query, key, value, mask, self.dropout)
+            return x
+        return MultiHeadAttentionBlock.fused_attention(query, key, value, mask, self.dropout.p if self.training else 0.0)
+
     def forward(self, q, k, v, mask):
         query = self.w_q(q) # (batch, seq_len, d_model) --> (batch, seq_len, d_model)
         key = self.w_k(k) # (batch, seq_len, d_model) --> (batch, seq_len, d_model)
@@ -125,7 +152,7 @@ class MultiHeadAttentionBlock(nn.Module):
         value = value.view(value.shape[0], value.shape[1], self.h, self.d_k).transpose(1, 2)
 
         # Calculate attention
-        x, self.attention_scores = MultiHeadAttentionBlock.attention(query, key, value, mask, self.dropout)
+        x = self.compute_attention(query, key, value, mask)
         
         # Combine all the heads together
         # (batch, h, seq_len, d_k) --> (batch, seq_len, h, d_k) --> (batch, seq_len, d_model)
@@ -135,6 +162,22 @@ class MultiHeadAttentionBlock(nn.Module):
         # (batch, seq_len, d_model) --> (batch, seq_len, d_model)  
         return self.w_o(x)
 
+    def project_kv(self, k, v):
+        # (batch, seq_len, d_model) --> (batch, h, seq_len, d_k), so keys and values can be cached between decode steps
+        key = self.w_k(k)
+        value = self.w_v(v)
+        key = key.view(key.shape[0], key.shape[1], self.h, self.d_k).transpose(1, 2)
+        value = value.view(value.shape[0], value.shape[1], self.h, self.d_k).transpose(1, 2)
+        return key, value
+
+    def attend(self, q, key, value, mask):
+        # Same as forward, but with keys and values that were already projected by project_kv
+        query = self.w_q(q)
+        query = query.view(query.shape[0], query.shape[1], self.h, self.d_k).transpose(1, 2)
+        x = self.compute_attention(query, key, value, mask)
+        x = x.transpose(1, 2).contiguous().view(x.shape[0], -1, self.h * self.d_k)
+        return self.w_o(x)
+
 class EncoderBlock(nn.Module):
 
     def __init__(self, features: int, self_attention_block: MultiHeadAttentionBlock, feed_forward_block: FeedForwardBlock, dropout: float) -> None:
@@ -174,6 +217,21 @@ class DecoderBlock(nn.Module):
         x = self.residual_connections[1](x, lambda x: self.cross_attention_block(x, encoder_output, encoder_output, src_mask))
         x = self.residual_connections[2](x, self.feed_forward_block)
         return x
+
+    def forward_step(self, x, cache, layer: int, src_mask):
+        # x: (batch, 1, d_model), only the newest target position
+        # Its key/value is written into the cache, so the position attends to every earlier one without a causal mask
+        def self_attention(x):
+            key, value = self.self_attention_block.project_kv(x, x)
+            position = cache.length
+            cache.self_keys[layer][:, :, position:position + 1] = key
+            cache.self_values[layer][:, :, position:position + 1] = value
+            return self.self_attention_block.attend(x, cache.self_keys[layer][:, :, :position + 1], cache.self_values[layer][:, :, :position + 1], None)
+
+        x = self.residual_connections[0](x, self_attention)
+        x = self.residual_connections[1](x, lambda x: self.cross_attention_block.attend(x, cache.cross_keys[layer], cache.cross_values[layer], src_mask))
+        x = self.residual_connections[2](x, self.feed_forward_block)
+        return x
     
 class Decoder(nn.Module):
 
@@ -187,6 +245,34 @@ class Decoder(nn.Module):
             x = layer(x, encoder_output, src_mask, tgt_mask)
         return self.norm(x)
 
+    def forward_step(self, x, cache, src_mask):
+        for i, layer in enumerate(self.layers):
+            x = layer.forward_step(x, cache, i, src_mask)
+        return self.norm(x)
+
+class DecodeCache:
+    # Keys and values of every decoder layer, kept between incremental decode steps
+    # self_keys/self_values: (batch, h, max_len, d_k) buffers filled one position per step
+    # cross_keys/cross_values: (batch, h, src_seq_len, d_k), computed once from the encoder output
+
+    def __init__(self, self_keys, self_values, cross_keys, cross_values, length: int=0) -> None:
+        self.self_keys = self_keys
+        self.self_values = self_values
+        self.cross_keys = cross_keys
+        self.cross_values = cross_values
+        self.length = length # Number of target positions already decoded
+
+    def index_select(self, index: torch.Tensor):
+        # Keep only the rows in index (in that order), e.g. to drop finished sequences from a batch
+        select = lambda tensors: [t.index_select(0, index) for t in tensors]
+        return DecodeCache(select(self.self_keys), select(self.self_values), select(self.cross_keys), select(self.cross_values), self.length)
+
+    def reorder_beams(self, index: torch.Tensor):
+        # Beam search: row i continues the hypothesis in row index[i]. Beams of one source share their
+        # cross-attention keys/values, and index never leaves a source's beams, so only the self-attention buffers move
+        select = lambda tensors: [t.index_select(0, index) for t in tensors]
+        return DecodeCache(select(self.self_keys), select(self.self_values), self.cross_keys, self.cross_values, self.length)
+
 class ProjectionLayer(nn.Module):
 
     def __init__(self, d_model, vocab_size) -> None:
@@ -220,12 +306,41 @@ class Transformer(nn.Module):
         tgt = self.tgt_embed(tgt)
         tgt = self.tgt_pos(tgt)
         return self.decoder(tgt, encoder_output, src_mask, tgt_mask)
+
+    def init_decode_cache(self, encoder_output: torch.Tensor, max_len: int) -> DecodeCache:
+        # Cross-attention keys/values only depend on the encoder output, so they are projected once here
+        batch = encoder_output.shape[0]
+        self_keys, self_values, cross_keys, cross_values = [], [], [], []
+        for layer in self.decoder.layers:
+            attention = layer.self_attention_block
+            self_keys.append(encoder_output.new_zeros(batch, attention.h, max_len, attention.d_k))
+            self_values.append(encoder_output.new_zeros(batch, attention.h, max_len, attention.d_k))
+            key, value = layer.cross_attention_block.project_kv(encoder_output, encoder_output)
+            cross_keys.append(key)
+            cross_values.append(value)
+        return DecodeCache(self_keys, self_values, cross_keys, cross_values)
+
+    def decode_step(self, src_mask: torch.Tensor, tgt: torch.Tensor, cache: DecodeCache):
+        # tgt: (batch, 1), the newest token of every sequence --> (batch, 1, d_model)
+        tgt = self.tgt_embed(tgt)
+        tgt = self.tgt_pos(tgt, offset=cache.length)
+        x = self.decoder.forward_step(tgt, cache, src_mask)
+        cache.length += 1
+        return x
     
     def project(self, x):
         # (batch, seq_len, vocab_size)
         return self.projection_layer(x)
+
+    def enable_attention_scores(self, enabled: bool=True):
+        # Makes every attention block keep its scores in .attention_scores (slower, uses the unfused path)
+        for module in self.modules():
+            if isinstance(module, MultiHeadAttentionBlock):
+                module.store_attention_scores = enabled
+                if not enabled:
+                    module.attention_scores = None
     
-def build_transformer(src_vocab_size: int, tgt_vocab_size: int, src_seq_len: int, tgt_seq_len: int, d_model: int=512, N: int=6, h: int=8, dropout: float=0.1, d_ff: int=2048) -> Transformer:
+def build_transformer(src_vocab_size: int, tgt_vocab_size: int, src_seq_len: int, tgt_seq_len: int, d_model: int=512, N: int=6, h: int=8, dropout: float=0.1, d_ff: int=2048, init_weights: bool=True) -> Transformer:
     # Create the embedding layers
     src_embed = InputEmbeddings(d_model, src_vocab_size)
     tgt_embed = InputEmbeddings(d_model, tgt_vocab_size)
@@ -262,8 +377,10 @@ def build_transformer(src_vocab_size: int, tgt_vocab_size: int, src_seq_len: int
     transformer = Transformer(encoder, decoder, src_embed, tgt_embed, src_pos, tgt_pos, projection_layer)
     
     # Initialize the parameters
-    for p in transformer.parameters():
-        if p.dim() > 1:
-            nn.init.xavier_uniform_(p)
+    # Skipped when the weights are about to be overwritten by a checkpoint anyway
+    if init_weights:
+        for p in transformer.parameters():
+            if p.dim() > 1:
+                nn.init.xavier_uniform_(p)
     
     return transformer
\ No newline at end of file
@@ -0,0 +1,164 @@
+#This module keeps one trained transformer resident in memory, so the backend loads the checkpoint once instead of on every request.
+import os
+import sys
+import threading
+import torch
+from config import get_config
+from SASTRA_Code_Converter_DL import get_model, Validate
+from translation_cache import TranslationCache
+import quantization
+import metrics
+
+CHECKPOINT_NAME = 'Training_1_24.pth'
+
+_models = {}
+_lock = threading.Lock()
+_warm_up_thread = None
+_translation_cache = None
+
+def checkpoint_path():
+    # PyInstaller unpacks bundled files into sys._MEIPASS
+    if getattr(sys, 'frozen', False):
+        base_path = sys._MEIPASS
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, CHECKPOINT_NAME)
+
+def checkpoint_tag(model_path):
+    # Changes whenever the checkpoint file is replaced, so caches derived from it can tell they are stale
+    if not os.path.exists(model_path):
+        return None
+    stat = os.stat(model_path)
+    return f"{os.path.basename(model_path)}:{stat.st_size}:{int(stat.st_mtime)}"
+
+def decoding_tag(config):
+    # Beam and greedy decoding (or other length limits) give different translations for the same ids
+    strategy = config.get('decode_strategy', 'greedy')
+    if strategy == 'beam':
+        strategy += f"{config['beam_size']}/{config.get('length_penalty')}"
+    tag = f"{strategy}:{config.get('length_ratio')}:{config.get('length_margin')}"
+    if config.get('autocast_dtype') not in (None, 'float32'):
+        tag += ':' + config['autocast_dtype']
+    return tag
+
+def quantize_enabled():
+    return os.environ.get('SASTRA_QUANTIZE', '0') == '1'
+
+def exported_enabled():
+    return os.environ.get('SASTRA_EXPORTED', '0') == '1'
+
+def exported_path(model_path):
+    return os.environ.get('SASTRA_EXPORTED_PATH') or os.path.splitext(model_path)[0] + '.ts'
+
+def mmap_enabled():
+    return os.environ.get('SASTRA_MMAP', '1') == '1'
+
+def quantized_cache_path(model_path):
+    return os.environ.get('SASTRA_QUANT_CACHE') or os.path.splitext(model_path)[0] + '.int8.pth'
+
+def load_checkpoint(model_path):
+    # Memory maps the checkpoint, so its tensors are backed by the file and only read in as they are used.
+    # The pages are private copy-on-write mappings of the page cache, so every process that maps the same
+    # file (batch_convert workers, several backends) shares one copy of the weights.
+    # Replace the checkpoint with a new file rather than writing over it while models are loaded from it
+    if mmap_enabled():
+        try:
+            return torch.load(model_path, map_location=torch.device('cpu'), mmap=True)
+        except RuntimeError as e:
+            # Checkpoints saved in the legacy (pre zip) format can't be memory mapped
+            print(f"[WARN] Could not memory map {os.path.basename(model_path)}, reading it into memory: {e}")
+    return torch.load(model_path, map_location=torch.device('cpu'))
+
+@metrics.timed('checkpoint_load')
+def load_model(model_path=None, quantized=False):
+    model_path = model_path or checkpoint_path()
+    config = get_config()
+
+    if exported_enabled():
+        # The TorchScript export skips building the Python model, see export.py
+        from export import ExportedModel
+        path = exported_path(model_path)
+        exported_model = ExportedModel.load(path, checkpoint_tag(model_path), quantized)
+        if exported_model is not None:
+            return exported_model
+        print(f"[WARN] No export of {os.path.basename(model_path)} at {path}, loading the eager model (run python export.py)")
+
+    # The parameters are created on the meta device (no memory, no random init) and the
+    # checkpoint tensors are assigned to them as they are, instead of copied into a second set
+    with torch.device('meta'):
+        model = get_model(config, init_weights=False)
+
+    if quantized:
+        # A model quantized by an earlier start-up is loaded as is
+        tag = checkpoint_tag(model_path)
+        cache_path = quantized_cache_path(model_path)
+        quantized_model = quantization.load_quantized(model, cache_path, tag)
+        if quantized_model is not None:
+            return quantized_model
+
+    checkpoint = load_checkpoint(model_path)
+    model.load_state_dict(checkpoint['model_state_dict'], assign=True)
+    del checkpoint
+    model.eval()
+
+    if quantized:
+        model = quantization.quantize_model(model)
+        try:
+            quantization.save_quantized(model, cache_path, tag)
+        except OSError as e:
+            print(f"[WARN] Could not cache the quantized model at {cache_path}: {e}")
+    return model
+
+def get_resident_model(model_path=None, quantized=None):
+    model_path = model_path or checkpoint_path()
+    quantized = quantize_enabled() if quantized is None else quantized
+    key = (model_path, quantized)
+    model = _models.get(key)
+    if model is None:
+        # Only one thread builds the model, the others wait for it and reuse it
+        with _lock:
+            model = _models.get(key)
+            if model is None:
+                model = load_model(model_path, quantized)
+                _models[key] = model
+    return model
+
+def get_translation_cache(model_path=None):
+    # One memo cache per process, persisted to SASTRA_CACHE_PATH when that is set
+    global _translation_cache
+    if _translation_cache is None:
+        with _lock:
+            if _translation_cache is None:
+                # Saved entries are only valid for the checkpoint (and precision) they were decoded with
+                tag = checkpoint_tag(model_path or checkpoint_path())
+                if tag and quantize_enabled():
+                    tag += ':int8'
+                if tag:
+                    tag += ':' + decoding_tag(get_config())
+                capacity = int(os.environ.get('SASTRA_CACHE_SIZE', 10000))
+                _translation_cache = TranslationCache(capacity, os.environ.get('SASTRA_CACHE_PATH'), tag)
+    return _translation_cache
+
+def is_loaded(model_path=None, quantized=None):
+    quantized = quantize_enabled() if quantized is None else quantized
+    return ((model_path or checkpoint_path()), quantized) in _models
+
+def warm_up(model_path=None, background=True):
+    global _warm_up_thread
+
+    def run():
+        try:
+            model = get_resident_model(model_path)
+            # One tiny translation so the first real request doesn't pay for lazy allocations
+            Validate(model, "int x = 0;", validate=False)
+            print('>>> AI model loaded and warmed up')
+        except Exception as e:
+            print(f"[ERROR] AI model warm-up failed: {e}")
+
+    if not background:
+        run()
+        return None
+    if _warm_up_thread is None or not _warm_up_thread.is_alive():
+        _warm_up_thread = threading.Thread(target=run, name='model-warm-up', daemon=True)
+        _warm_up_thread.start()
+    return _warm_up_thread
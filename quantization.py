@@ -0,0 +1,135 @@
+#This module adds an opt-in int8 inference mode: the nn.Linear layers of the attention, feed-forward and projection blocks
+#are dynamically quantized (int8 weights, activations quantized on the fly), which is faster and smaller on CPU.
+#Parity report: python quantization.py [file.cpp]
+import argparse
+import io
+import os
+import time
+import torch
+import torch.nn as nn
+from torch.ao.quantization import quantize_dynamic
+import torch.ao.nn.quantized.dynamic as nnqd
+from model import MultiHeadAttentionBlock, FeedForwardBlock, ProjectionLayer
+
+QUANTIZED_BLOCKS = (MultiHeadAttentionBlock, FeedForwardBlock, ProjectionLayer)
+
+def quantized_layer_names(model):
+    # Names of the nn.Linear layers that get int8 weights
+    names = set()
+    for name, module in model.named_modules():
+        if isinstance(module, QUANTIZED_BLOCKS):
+            for child_name, child in module.named_children():
+                if isinstance(child, nn.Linear):
+                    names.add(f"{name}.{child_name}")
+    return names
+
+def quantize_model(model, inplace=True):
+    model.eval()
+    return quantize_dynamic(model, quantized_layer_names(model), dtype=torch.qint8, inplace=inplace)
+
+def _swap_in_quantized_layers(model):
+    # Replaces the float layers by empty int8 ones, ready for load_state_dict of a saved quantized model
+    # This skips quantizing weights that are about to be overwritten anyway
+    for name in quantized_layer_names(model):
+        parent_name, child_name = name.rsplit('.', 1)
+        parent = model.get_submodule(parent_name)
+        linear = getattr(parent, child_name)
+        setattr(parent, child_name, nnqd.Linear(linear.in_features, linear.out_features, bias_=linear.bias is not None, dtype=torch.qint8))
+    return model
+
+def save_quantized(model, path, tag=None):
+    # tag identifies the float checkpoint the model was quantized from
+    tmp_path = path + '.tmp'
+    torch.save({'tag': tag, 'model_state_dict': model.state_dict()}, tmp_path)
+    os.replace(tmp_path, path)
+
+def load_quantized(model, path, tag=None):
+    # model is a float skeleton from get_model (on the meta device or not); returns None when the cache is missing or from another checkpoint
+    if not os.path.exists(path):
+        return None
+    checkpoint = torch.load(path, map_location=torch.device('cpu'), weights_only=False, mmap=True)
+    if checkpoint.get('tag') != tag:
+        return None
+    model = _swap_in_quantized_layers(model)
+    model.load_state_dict(checkpoint['model_state_dict'], assign=True)
+    model.eval()
+    return model
+
+def model_size_mb(model):
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / 2**20
+
+def resident_mb(model_path, quantized, cpp_lines):
+    # Resident memory before loading one model and after translating cpp_lines with it (an mmap-loaded
+    # checkpoint only becomes resident once its weights are used), run in a fresh process per mode
+    import model_registry
+    from SASTRA_Code_Converter_DL import Validate
+    from benchmark import current_rss_mb
+    before = current_rss_mb()
+    model = model_registry.load_model(model_path, quantized)
+    Validate(model, '\n'.join(cpp_lines), validate=False)
+    return before, current_rss_mb()
+
+def measure_rss(model_path, cpp_lines):
+    # fp32 and int8 RSS, each in its own new process. int8 is measured twice and the second run kept,
+    # the first start may still have to quantize the float checkpoint and save the int8 cache
+    from concurrent.futures import ProcessPoolExecutor
+    results = {}
+    for label, quantized in (('fp32', False), ('int8', True), ('int8', True)):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            before, after = executor.submit(resident_mb, model_path, quantized, cpp_lines).result()
+        results[f'{label}_rss_mb'] = after
+        results[f'{label}_model_rss_mb'] = after - before
+    return results
+
+def parity_report(float_model, quantized_model, cpp_lines, model_path=None):
+    # Translates the same lines with both models and reports how often the int8 output matches fp32 exactly,
+    # over the lines that reach the model. With model_path, also the memory each mode takes to load
+    from SASTRA_Code_Converter_DL import Validate
+    from benchmark import model_line_agreement
+
+    cpp_lines = '\n'.join(cpp_lines).strip().split('\n') # The lines as Validate sees them
+    results = {}
+    for label, model in (('fp32', float_model), ('int8', quantized_model)):
+        start = time.perf_counter()
+        rust_code = Validate(model, '\n'.join(cpp_lines), validate=False)
+        results[label] = {
+            'lines': rust_code.split('\n'),
+            'seconds': time.perf_counter() - start,
+            'size_mb': model_size_mb(model),
+        }
+    report = {'lines': len(cpp_lines)}
+    report.update(model_line_agreement(cpp_lines, results['fp32']['lines'], results['int8']['lines']))
+    report.update({
+        'fp32_seconds': results['fp32']['seconds'],
+        'int8_seconds': results['int8']['seconds'],
+        'speedup': results['fp32']['seconds'] / results['int8']['seconds'],
+        'fp32_size_mb': results['fp32']['size_mb'],
+        'int8_size_mb': results['int8']['size_mb'],
+    })
+    if model_path is not None:
+        report.update(measure_rss(model_path, cpp_lines))
+    return report
+
+if __name__ == '__main__':
+    import copy
+    import json
+    import model_registry
+    from benchmark import SAMPLE_LINES
+
+    parser = argparse.ArgumentParser(description='Compare int8 and fp32 translations on a held-out set of C++ lines')
+    parser.add_argument('input', nargs='?', help='C++ file with the held-out lines (defaults to a small built-in sample)')
+    parser.add_argument('--checkpoint', default=None)
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            cpp_lines = [line for line in f.read().split('\n') if line.strip()]
+    else:
+        cpp_lines = SAMPLE_LINES
+
+    model_path = args.checkpoint or model_registry.checkpoint_path()
+    float_model = model_registry.load_model(model_path)
+    quantized_model = quantize_model(copy.deepcopy(float_model))
+    print(json.dumps(parity_report(float_model, quantized_model, cpp_lines, model_path), indent=2))
@@ -31,6 +31,36 @@ outputBtn.addEventListener('click', async () => {
   }
 });
 
+// Reads an NDJSON response and calls onEvent with every parsed line
+async function readEvents(response, onEvent) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split('\n');
+    buffer = lines.pop();
+    for (const line of lines) {
+      if (line.trim()) onEvent(JSON.parse(line));
+    }
+  }
+  if (buffer.trim()) onEvent(JSON.parse(buffer));
+}
+
+// Polls a backend job until it is finished and calls onProgress with every intermediate state
+async function waitForJob(jobId, onProgress, interval = 500) {
+  while (true) {
+    const response = await fetch(`http://127.0.0.1:5000/jobs/${jobId}`);
+    const job = await response.json();
+    if (!response.ok) return { status: 'failed', error: job.error };
+    if (['done', 'failed', 'cancelled'].includes(job.status)) return job;
+    onProgress(job);
+    await new Promise((resolve) => setTimeout(resolve, interval));
+  }
+}
+
 convertBtn.addEventListener('click', async () => {
   if (!selectedCppFile || !selectedOutputFolder) {
     alert("Please select both the input file and output folder.");
@@ -40,7 +70,7 @@ convertBtn.addEventListener('click', async () => {
   const cppCode = fs.readFileSync(selectedCppFile, 'utf8');
 
   try {
-    const response = await fetch('http://127.0.0.1:5000/convert', {
+    const response = await fetch('http://127.0.0.1:5000/convert_stream', {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({
@@ -49,12 +79,15 @@ convertBtn.addEventListener('click', async () => {
       })
     });
 
-    const result = await response.json();
+    let result = null;
+    await readEvents(response, (event) => {
+      if (event.type !== 'lines') result = event;
+    });
 
-    if (response.ok) {
-      alert('✅ Rule-based conversion successful!\nSaved to: ' + path.join(selectedOutputFolder, 'output_sastra.rs'));
+    if (result && result.type === 'complete') {
+      alert('✅ Rule-based conversion successful!\nSaved to: ' + result.output_path);
     } else {
-      alert('Error: ' + result.error);
+      alert('Error: ' + (result ? result.error : 'conversion stopped unexpectedly'));
     }
   } catch (err) {
     console.error("Fetch error:", err);
@@ -69,25 +102,39 @@ convertAiBtn.addEventListener('click', async () => {
   }
 
   const cppCode = fs.readFileSync(selectedCppFile, 'utf8');
+  aiStatus.innerText = 'AI conversion in progress...';
   aiStatus.classList.remove('hidden');
 
   try {
-    const response = await fetch('http://127.0.0.1:5000/convert_ai', {
+    // The conversion runs as a background job on the backend, so the other requests stay responsive while the model works
+    const response = await fetch('http://127.0.0.1:5000/jobs', {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({
+        mode: 'ai',
         code: cppCode,
         output_folder: selectedOutputFolder
       })
     });
+    const job = await response.json();
+    if (!response.ok) {
+      aiStatus.classList.add('hidden');
+      alert('Error: ' + job.error);
+      return;
+    }
+
+    const result = await waitForJob(job.id, (progress) => {
+      if (progress.total) {
+        aiStatus.innerText = `AI conversion in progress... ${progress.done}/${progress.total} lines`;
+      }
+    });
 
     aiStatus.classList.add('hidden');
-    const result = await response.json();
 
-    if (response.ok) {
-      alert('🤖 AI conversion successful!\nSaved to: ' + path.join(selectedOutputFolder, 'output_ai.rs'));
+    if (result.status === 'done') {
+      alert('🤖 AI conversion successful!\nSaved to: ' + result.result.output_path);
     } else {
-      alert('Error: ' + result.error);
+      alert('Error: ' + (result.error || 'conversion ' + result.status));
     }
   } catch (err) {
     aiStatus.classList.add('hidden');
@@ -0,0 +1,5640 @@
+pub struct Shape0 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape0 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest1(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest2(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest3(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum4(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*28;
+
+}
+while total>280 {
+let mut total = return{};
+}
+fn sum5(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*64;
+
+}
+while total>640 {
+let mut total = return{};
+}
+// Rust generics for template: <T>
+fn largest6(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum7(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*79;
+
+}
+while total>790 {
+let mut total = return{};
+}
+// Rust generics for template: <T>
+fn largest8(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe9(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    36 => {
+println!("36");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum10(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*77;
+
+}
+while total>770 {
+let mut total = return{};
+}
+fn sum11(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*42;
+
+}
+while total>420 {
+let mut total = return{};
+}
+fn sum12(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*4;
+
+}
+while total>40 {
+let mut total = return{};
+}
+pub struct Shape13 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape13 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn describe14(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    89 => {
+println!("89");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum15(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*56;
+
+}
+while total>560 {
+let mut total = return{};
+}
+fn describe16(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    69 => {
+println!("69");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+// Rust generics for template: <T>
+fn largest17(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+pub struct Shape18 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape18 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+fn describe19(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    31 => {
+println!("31");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+// Rust generics for template: <T>
+fn largest20(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum21(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*39;
+
+}
+while total>390 {
+let mut total = return{};
+}
+pub struct Shape22 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape22 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn read23() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/82.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read24() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/17.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape25 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape25 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+fn read26() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/40.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest27(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest28(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum29(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*77;
+
+}
+while total>770 {
+let mut total = return{};
+}
+fn describe30(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    63 => {
+println!("63");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+// Rust generics for template: <T>
+fn largest31(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe32(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    55 => {
+println!("55");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape33 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape33 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+pub struct Shape34 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape34 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest35(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest36(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum37(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*95;
+
+}
+while total>950 {
+let mut total = return{};
+}
+fn sum38(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*62;
+
+}
+while total>620 {
+let mut total = return{};
+}
+pub struct Shape39 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape39 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+pub struct Shape40 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape40 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+pub struct Shape41 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape41 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+fn read42() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/67.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read43() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/75.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read44() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/60.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape45 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape45 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+pub struct Shape46 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape46 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn sum47(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*56;
+
+}
+while total>560 {
+let mut total = return{};
+}
+fn read48() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/63.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape49 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape49 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+fn read50() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/64.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read51() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/55.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape52 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape52 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field1 + step; if (step > 0) { self.field3 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field3 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn sum53(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*78;
+
+}
+while total>780 {
+let mut total = return{};
+}
+fn describe54(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    31 => {
+println!("31");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape55 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape55 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+fn read56() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/72.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn sum57(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*6;
+
+}
+while total>60 {
+let mut total = return{};
+}
+fn sum58(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*12;
+
+}
+while total>120 {
+let mut total = return{};
+}
+fn sum59(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*59;
+
+}
+while total>590 {
+let mut total = return{};
+}
+fn read60() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/98.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read61() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/33.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape62 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape62 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+fn sum63(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*39;
+
+}
+while total>390 {
+let mut total = return{};
+}
+fn describe64(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    23 => {
+println!("23");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape65 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape65 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+fn read66() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/84.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read67() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/60.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest68(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum69(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*16;
+
+}
+while total>160 {
+let mut total = return{};
+}
+// Rust generics for template: <T>
+fn largest70(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest71(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn read72() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/26.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read73() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/15.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape74 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape74 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+fn describe75(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    4 => {
+println!("4");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+// Rust generics for template: <T>
+fn largest76(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum77(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*20;
+
+}
+while total>200 {
+let mut total = return{};
+}
+fn describe78(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    94 => {
+println!("94");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape79 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape79 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+pub struct Shape80 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape80 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+fn sum81(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*69;
+
+}
+while total>690 {
+let mut total = return{};
+}
+pub struct Shape82 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape82 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field1 + step; if (step > 0) { self.field3 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field3 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn read83() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/9.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn describe84(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    18 => {
+println!("18");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn read85() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/8.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn sum86(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*11;
+
+}
+while total>110 {
+let mut total = return{};
+}
+fn read87() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/41.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn describe88(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    97 => {
+println!("97");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape89 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape89 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+pub struct Shape90 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape90 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest91(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+pub struct Shape92 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape92 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn read93() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/27.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn describe94(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    14 => {
+println!("14");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+// Rust generics for template: <T>
+fn largest95(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe96(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    77 => {
+println!("77");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum97(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*65;
+
+}
+while total>650 {
+let mut total = return{};
+}
+// Rust generics for template: <T>
+fn largest98(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+pub struct Shape99 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape99 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+pub struct Shape100 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape100 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+fn describe101(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    4 => {
+println!("4");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn read102() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/27.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn describe103(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    74 => {
+println!("74");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+// Rust generics for template: <T>
+fn largest104(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn read105() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/29.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn sum106(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*88;
+
+}
+while total>880 {
+let mut total = return{};
+}
+pub struct Shape107 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape107 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field1 + step; if (step > 0) { self.field3 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field3 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn describe108(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    70 => {
+println!("70");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum109(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*10;
+
+}
+while total>100 {
+let mut total = return{};
+}
+fn describe110(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    12 => {
+println!("12");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn describe111(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    23 => {
+println!("23");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn describe112(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    70 => {
+println!("70");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn read113() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/36.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape114 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape114 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field1 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+fn read115() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/45.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read116() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/16.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape117 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape117 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+pub struct Shape118 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape118 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest119(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest120(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe121(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    20 => {
+println!("20");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum122(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*45;
+
+}
+while total>450 {
+let mut total = return{};
+}
+pub struct Shape123 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape123 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+pub struct Shape124 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape124 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+fn read125() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/36.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape126 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape126 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn sum127(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*37;
+
+}
+while total>370 {
+let mut total = return{};
+}
+fn read128() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/7.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape129 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape129 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+fn sum130(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*54;
+
+}
+while total>540 {
+let mut total = return{};
+}
+fn describe131(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    7 => {
+println!("7");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape132 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape132 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest133(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe134(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    23 => {
+println!("23");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum135(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*22;
+
+}
+while total>220 {
+let mut total = return{};
+}
+// Rust generics for template: <T>
+fn largest136(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn read137() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/71.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read138() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/72.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest139(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum140(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*42;
+
+}
+while total>420 {
+let mut total = return{};
+}
+fn read141() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/28.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn sum142(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*7;
+
+}
+while total>70 {
+let mut total = return{};
+}
+fn read143() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/3.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape144 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape144 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field1 + step; if (step > 0) { self.field3 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field3 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn read145() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/52.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn sum146(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*53;
+
+}
+while total>530 {
+let mut total = return{};
+}
+fn read147() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/10.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest148(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn read149() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/16.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape150 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape150 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+fn describe151(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    35 => {
+println!("35");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn describe152(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    71 => {
+println!("71");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn describe153(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    41 => {
+println!("41");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn read154() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/33.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read155() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/12.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest156(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+pub struct Shape157 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape157 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+fn read158() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/51.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read159() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/7.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read160() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/25.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read161() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/76.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read162() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/33.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape163 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape163 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn sum164(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*30;
+
+}
+while total>300 {
+let mut total = return{};
+}
+// Rust generics for template: <T>
+fn largest165(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn read166() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/11.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn sum167(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*72;
+
+}
+while total>720 {
+let mut total = return{};
+}
+fn sum168(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*95;
+
+}
+while total>950 {
+let mut total = return{};
+}
+fn sum169(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*4;
+
+}
+while total>40 {
+let mut total = return{};
+}
+fn read170() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/39.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest171(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum172(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*21;
+
+}
+while total>210 {
+let mut total = return{};
+}
+fn read173() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/66.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape174 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape174 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn describe175(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    21 => {
+println!("21");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn read176() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/42.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape177 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape177 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+fn describe178(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    28 => {
+println!("28");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum179(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*71;
+
+}
+while total>710 {
+let mut total = return{};
+}
+pub struct Shape180 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape180 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest181(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe182(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    70 => {
+println!("70");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn describe183(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    8 => {
+println!("8");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum184(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*34;
+
+}
+while total>340 {
+let mut total = return{};
+}
+// Rust generics for template: <T>
+fn largest185(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+pub struct Shape186 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape186 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field1 + step; if (step > 0) { self.field3 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field3 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest187(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest188(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe189(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    45 => {
+println!("45");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+// Rust generics for template: <T>
+fn largest190(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest191(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum192(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*75;
+
+}
+while total>750 {
+let mut total = return{};
+}
+fn read193() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/9.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn describe194(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    76 => {
+println!("76");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn describe195(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    77 => {
+println!("77");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn read196() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/19.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest197(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest198(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+pub struct Shape199 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape199 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn sum200(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*64;
+
+}
+while total>640 {
+let mut total = return{};
+}
+pub struct Shape201 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape201 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field1 + step; if (step > 0) { self.field3 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field3 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn describe202(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    89 => {
+println!("89");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn read203() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/32.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest204(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest205(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+pub struct Shape206 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape206 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+fn sum207(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*8;
+
+}
+while total>80 {
+let mut total = return{};
+}
+pub struct Shape208 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape208 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+fn describe209(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    67 => {
+println!("67");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn read210() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/41.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read211() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/90.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read212() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/72.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest213(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum214(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*78;
+
+}
+while total>780 {
+let mut total = return{};
+}
+pub struct Shape215 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape215 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+fn read216() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/21.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn describe217(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    56 => {
+println!("56");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum218(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*74;
+
+}
+while total>740 {
+let mut total = return{};
+}
+// Rust generics for template: <T>
+fn largest219(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn read220() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/93.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape221 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape221 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+fn sum222(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*69;
+
+}
+while total>690 {
+let mut total = return{};
+}
+fn sum223(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*34;
+
+}
+while total>340 {
+let mut total = return{};
+}
+fn sum224(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*36;
+
+}
+while total>360 {
+let mut total = return{};
+}
+pub struct Shape225 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape225 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest226(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest227(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn read228() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/23.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn describe229(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    58 => {
+println!("58");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+// Rust generics for template: <T>
+fn largest230(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum231(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*29;
+
+}
+while total>290 {
+let mut total = return{};
+}
+pub struct Shape232 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape232 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn read233() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/86.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn describe234(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    37 => {
+println!("37");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape235 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape235 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest236(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum237(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*76;
+
+}
+while total>760 {
+let mut total = return{};
+}
+pub struct Shape238 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape238 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+fn describe239(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    28 => {
+println!("28");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn describe240(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    38 => {
+println!("38");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn describe241(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    71 => {
+println!("71");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn read242() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/36.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read243() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/76.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest244(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+pub struct Shape245 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape245 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field1 + step; if (step > 0) { self.field3 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field3 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn sum246(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*55;
+
+}
+while total>550 {
+let mut total = return{};
+}
+pub struct Shape247 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape247 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+fn sum248(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*38;
+
+}
+while total>380 {
+let mut total = return{};
+}
+fn sum249(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*5;
+
+}
+while total>50 {
+let mut total = return{};
+}
+fn sum250(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*74;
+
+}
+while total>740 {
+let mut total = return{};
+}
+fn read251() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/71.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn describe252(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    88 => {
+println!("88");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape253 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape253 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field1 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+pub struct Shape254 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape254 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field1 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+fn sum255(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*2;
+
+}
+while total>20 {
+let mut total = return{};
+}
+// Rust generics for template: <T>
+fn largest256(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn read257() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/46.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest258(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+pub struct Shape259 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape259 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest260(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe261(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    50 => {
+println!("50");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum262(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*73;
+
+}
+while total>730 {
+let mut total = return{};
+}
+pub struct Shape263 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape263 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+pub struct Shape264 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape264 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+fn describe265(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    91 => {
+println!("91");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape266 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape266 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+fn sum267(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*69;
+
+}
+while total>690 {
+let mut total = return{};
+}
+// Rust generics for template: <T>
+fn largest268(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest269(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn read270() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/53.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape271 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape271 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn describe272(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    97 => {
+println!("97");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn read273() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/83.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn sum274(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*82;
+
+}
+while total>820 {
+let mut total = return{};
+}
+fn describe275(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    54 => {
+println!("54");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+// Rust generics for template: <T>
+fn largest276(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe277(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    36 => {
+println!("36");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape278 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape278 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest279(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+pub struct Shape280 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape280 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+fn read281() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/61.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn describe282(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    64 => {
+println!("64");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape283 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape283 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+fn sum284(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*67;
+
+}
+while total>670 {
+let mut total = return{};
+}
+pub struct Shape285 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape285 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn sum286(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*47;
+
+}
+while total>470 {
+let mut total = return{};
+}
+// Rust generics for template: <T>
+fn largest287(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe288(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    4 => {
+println!("4");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn describe289(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    66 => {
+println!("66");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum290(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*90;
+
+}
+while total>900 {
+let mut total = return{};
+}
+fn read291() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/53.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read292() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/79.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape293 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape293 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+fn read294() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/44.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn sum295(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*10;
+
+}
+while total>100 {
+let mut total = return{};
+}
+pub struct Shape296 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape296 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field1 + step; if (step > 0) { self.field3 += 1;
+
+}
+
+
+fn method3(&mut self, step: i32) -> i32 {
+        self.field3 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+pub struct Shape297 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+}
+
+
+impl Shape297 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field1 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+pub struct Shape298 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+}
+
+
+impl Shape298 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field1 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field2 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field1 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+fn describe299(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    80 => {
+println!("80");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape300 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape300 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+fn read301() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/63.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn read302() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/80.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn describe303(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    93 => {
+println!("93");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+pub struct Shape304 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape304 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest305(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest306(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe307(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    99 => {
+println!("99");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn describe308(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    36 => {
+println!("36");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn describe309(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    11 => {
+println!("11");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+// Rust generics for template: <T>
+fn largest310(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe311(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    76 => {
+println!("76");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn read312() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/79.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape313 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape313 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field1 + step; if (step > 0) { self.field0 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest314(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn read315() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/48.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest316(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum317(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*32;
+
+}
+while total>320 {
+let mut total = return{};
+}
+fn describe318(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    93 => {
+println!("93");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn read319() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/93.0;
+println!("{}: {} {}", name, count, ratio);
+}
+fn sum320(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*10;
+
+}
+while total>100 {
+let mut total = return{};
+}
+// Rust generics for template: <T>
+fn largest321(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest322(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe323(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    14 => {
+println!("14");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum324(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*7;
+
+}
+while total>70 {
+let mut total = return{};
+}
+fn sum325(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*78;
+
+}
+while total>780 {
+let mut total = return{};
+}
+fn describe326(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    98 => {
+println!("98");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn sum327(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*89;
+
+}
+while total>890 {
+let mut total = return{};
+}
+pub struct Shape328 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape328 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+
+
+fn method2(&mut self, step: i32) -> i32 {
+        self.field2 = self.field2 + step; if (step > 0) { self.field1 += 1;
+
+}
+}
+
+
+fn read329() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/86.0;
+println!("{}: {} {}", name, count, ratio);
+}
+pub struct Shape330 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+}
+
+
+impl Shape330 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field0 + step; if (step > 0) { self.field2 += 1;
+
+}
+}
+
+
+// Rust generics for template: <T>
+fn largest331(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest332(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+// Rust generics for template: <T>
+fn largest333(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn describe334(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    98 => {
+println!("98");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+fn describe335(value: i32) {
+match value {
+    1 => {
+println!("one");
+    },
+    31 => {
+println!("31");
+    },
+    _ => {
+println!("other");
+}
+}
+}
+// Rust generics for template: <T>
+fn largest336(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+pub struct Shape337 {
+
+    pub field0: i32,
+
+    pub field1: i32,
+
+    pub field2: i32,
+
+    pub field3: i32,
+
+    pub field4: i32,
+
+}
+
+
+impl Shape337 {
+
+pub fn new(v: i32) -> Self {
+        // Processed initialization
+
+        Self {
+
+            // field initializations here
+
+}
+}
+
+
+fn method0(&mut self, step: i32) -> i32 {
+        self.field0 = self.field3 + step; if (step > 0) { self.field0 += 1;
+
+}
+
+
+fn method1(&mut self, step: i32) -> i32 {
+        self.field1 = self.field0 + step; if (step > 0) { self.field3 += 1;
+
+}
+}
+
+
+fn read338() {
+let mut count = int{};
+let mut count = String::new();
+std::io::stdin().read_line(&mut count).unwrap();
+let count: i32 = count.trim().parse().unwrap();
+let name = String::from("item");
+let ratio: f64 = count/59.0;
+println!("{}: {} {}", name, count, ratio);
+}
+// Rust generics for template: <T>
+fn largest339(a: /* UNKNOWN TYPE */, b: /* UNKNOWN TYPE */) -> /* UNKNOWN TYPE */ {
+if a>b {
+let mut a = return{};
+}
+let mut b = return{};
+}
+fn sum340(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*77;
+
+}
+while total>770 {
+let mut total = return{};
+}
+fn sum341(n: i32) -> i32 {
+let mut total: i32 = 0;
+for i in (0..n).step_by(1) {
+total+=i*29;
+
+}
+while total>290 {
+let mut total = return{};
+}
+fn main(){
+
+println!("done");
+}
\ No newline at end of file
@@ -0,0 +1,107 @@
+#Incremental tree conversion: the manifest decides which files are converted again and which lines are reused,
+#a wrong decision would leave stale output on disk
+import pytest
+import torch
+import batch_convert
+import manifest
+import SASTRA_Code_Converter_DL as S
+from model import build_transformer
+from benchmark import SAMPLE_LINES, generate_corpus
+
+SOURCES = {
+    'a.cpp': generate_corpus(60, 1),
+    'lib/b.cpp': generate_corpus(60, 2),
+    'lib/c.h': 'int square(int x) {\n    return x * x;\n}\n',
+}
+
+@pytest.fixture
+def tree(tmp_path):
+    src_dir, out_dir = tmp_path / 'src', tmp_path / 'out'
+    for name, code in SOURCES.items():
+        path = src_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(code, encoding='utf-8')
+    return src_dir, out_dir
+
+def convert(tree, **kwargs):
+    src_dir, out_dir = tree
+    return batch_convert.convert_tree(str(src_dir), str(out_dir), 'rule', workers=1, progress=False, **kwargs)
+
+def statuses(summary):
+    return {entry['input'].replace('\\', '/').split('/src/', 1)[1]: entry['status'] for entry in summary['results']}
+
+def test_second_run_skips_unchanged_files(tree):
+    first = convert(tree)
+    assert first['converted'] == len(SOURCES) and first['failed'] == 0
+    outputs = {path: path.read_text(encoding='utf-8') for path in tree[1].rglob('*.rs')}
+    second = convert(tree)
+    assert second['unchanged'] == len(SOURCES) and second['converted'] == 0
+    assert {path: path.read_text(encoding='utf-8') for path in tree[1].rglob('*.rs')} == outputs
+
+def test_edited_source_is_converted_again(tree):
+    convert(tree)
+    (tree[0] / 'lib' / 'c.h').write_text('int cube(int x) {\n    return x * x * x;\n}\n', encoding='utf-8')
+    summary = convert(tree)
+    assert statuses(summary) == {'a.cpp': 'unchanged', 'lib/b.cpp': 'unchanged', 'lib/c.h': 'ok'}
+    assert 'cube' in (tree[1] / 'lib' / 'c.rs').read_text(encoding='utf-8')
+
+def test_tampered_output_is_converted_again(tree):
+    convert(tree)
+    output_path = tree[1] / 'a.rs'
+    expected = output_path.read_text(encoding='utf-8')
+    output_path.write_text(expected + '\n// edited by hand\n', encoding='utf-8')
+    summary = convert(tree)
+    assert statuses(summary)['a.cpp'] == 'ok'
+    assert output_path.read_text(encoding='utf-8') == expected
+
+def test_deleted_output_is_converted_again(tree):
+    convert(tree)
+    (tree[1] / 'lib' / 'b.rs').unlink()
+    assert statuses(convert(tree))['lib/b.cpp'] == 'ok'
+    assert (tree[1] / 'lib' / 'b.rs').exists()
+
+def test_converter_version_change_converts_everything(tree, monkeypatch):
+    convert(tree)
+    monkeypatch.setattr(manifest, 'CONVERTER_VERSION', manifest.CONVERTER_VERSION + 1)
+    assert convert(tree)['converted'] == len(SOURCES)
+
+def test_converter_source_change_converts_everything(tree, tmp_path, monkeypatch):
+    # An extra absolute path stands in for an edited sastra.py
+    rules = tmp_path / 'rules.py'
+    rules.write_text('RULES = 1\n', encoding='utf-8')
+    monkeypatch.setitem(manifest.CONVERTER_MODULES, 'rule', manifest.CONVERTER_MODULES['rule'] + (str(rules),))
+    convert(tree)
+    assert convert(tree)['unchanged'] == len(SOURCES)
+    rules.write_text('RULES = 2\n', encoding='utf-8')
+    assert convert(tree)['converted'] == len(SOURCES)
+
+def test_force_converts_everything(tree):
+    convert(tree)
+    assert convert(tree, force=True)['converted'] == len(SOURCES)
+
+def test_line_outputs_survive_a_save(tmp_path):
+    path = str(tmp_path / manifest.MANIFEST_NAME)
+    saved = manifest.Manifest(path, 'ai')
+    saved.record('a.cpp', 'source', 'a.rs', 'output', {'hash': 'let x = 1;'})
+    saved.save()
+    loaded = manifest.Manifest(path, 'ai')
+    assert loaded.line_outputs('a.cpp') == {'hash': 'let x = 1;'}
+    assert manifest.Manifest(path, 'rule').line_outputs('a.cpp') == {} # Another mode starts over
+
+def test_ai_reuse_matches_fresh_translation(monkeypatch):
+    torch.manual_seed(0)
+    model = build_transformer(S.cpp_size, S.rust_size, S.config['seq_len'], S.config['seq_len'], d_model=64, N=2, d_ff=128).eval()
+    with torch.no_grad():
+        model.projection_layer.proj.bias[S.rust_vocabulary_1.get('[EOS]')] += 0.7
+    monkeypatch.setattr(batch_convert, '_worker', {'mode': 'ai', 'model': model, 'cache': None})
+
+    cpp_code = '\n'.join(SAMPLE_LINES)
+    rust_code, lines, reused = batch_convert.translate_source(cpp_code)
+    assert rust_code == S.Validate(model, cpp_code, validate=False) and reused == 0
+
+    # Edit one model line and add one, the other lines come from the previous run
+    edited = SAMPLE_LINES[:2] + ['int cube = x * x * x;'] + SAMPLE_LINES[3:] + ['for (int j = 0; j < m; j++) {']
+    edited_code = '\n'.join(edited)
+    rust_code, _, reused = batch_convert.translate_source(edited_code, lines)
+    assert reused > 0
+    assert rust_code == S.Validate(model, edited_code, validate=False)
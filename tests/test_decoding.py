@@ -0,0 +1,75 @@
+#Parity checks for the cached, batched decoders against the reference greedy_decode loop, on a small seeded model.
+#eos_bias raises the [EOS] logit so that rows of the same batch stop at different steps
+import pytest
+import torch
+import SASTRA_Code_Converter_DL as S
+from model import build_transformer
+from decoding import greedy_decode, greedy_decode_batch, decode_batch
+from benchmark import SAMPLE_LINES, model_inputs
+
+MAX_LEN = S.config['seq_len']
+SOS_ID, EOS_ID = S.rust_vocabulary_1.get('[SOS]'), S.rust_vocabulary_1.get('[EOS]')
+REFERENCE_CONFIG = {'length_ratio': None} # No output limit other than MAX_LEN, like greedy_decode
+
+def small_model(eos_bias=0.0):
+    torch.manual_seed(0)
+    model = build_transformer(S.cpp_size, S.rust_size, MAX_LEN, MAX_LEN, d_model=64, N=2, d_ff=128).eval()
+    with torch.no_grad():
+        model.projection_layer.proj.bias[EOS_ID] += eos_bias
+    return model
+
+def reference(model, source, source_mask):
+    with torch.no_grad():
+        return [greedy_decode(model, source[i:i + 1], source_mask[i:i + 1], SOS_ID, EOS_ID, MAX_LEN) for i in range(source.shape[0])]
+
+@pytest.mark.parametrize('eos_bias', [0.0, 0.7, 1.0])
+def test_decode_batch_matches_reference(eos_bias):
+    # Rows padded from sources of different lengths, some ending early and some running to MAX_LEN
+    model = small_model(eos_bias)
+    source, source_mask = model_inputs(SAMPLE_LINES)
+    with torch.no_grad():
+        outputs = decode_batch(model, source, source_mask, SOS_ID, EOS_ID, MAX_LEN, REFERENCE_CONFIG)
+    assert outputs == reference(model, source, source_mask)
+
+@pytest.mark.parametrize('check_every', [1, 3])
+def test_finished_rows_leave_the_batch_without_changing_outputs(check_every):
+    model = small_model(0.7)
+    source, source_mask = model_inputs(SAMPLE_LINES)
+    with torch.no_grad():
+        outputs = greedy_decode_batch(model, source, source_mask, SOS_ID, EOS_ID, MAX_LEN, check_every=check_every)
+    assert outputs == reference(model, source, source_mask)
+
+def test_batch_trimmed_to_its_longest_row_matches_reference():
+    # translate_lines pads every batch only to its longest line
+    model = small_model(0.7)
+    source, source_mask = model_inputs(SAMPLE_LINES)
+    width = int(source_mask.sum(dim=-1).max())
+    with torch.no_grad():
+        outputs = decode_batch(model, source[:, :width], source_mask[..., :width], SOS_ID, EOS_ID, MAX_LEN, REFERENCE_CONFIG)
+    assert outputs == reference(model, source, source_mask)
+
+def test_validate_cached_matches_uncached():
+    model = small_model(0.7)
+    cpp_code = '\n'.join(SAMPLE_LINES)
+    assert S.Validate(model, cpp_code, validate=False) == S.Validate(model, cpp_code, validate=False, use_cache=False)
+
+def exported(model, tmp_path):
+    from export import export_model, ExportedModel
+    path = str(tmp_path / 'model.ts')
+    export_model(model, path, MAX_LEN, tag='test')
+    return ExportedModel.load(path, 'test')
+
+def test_exported_model_matches_reference(tmp_path):
+    model = small_model(0.7)
+    exported_model = exported(model, tmp_path)
+    source, source_mask = model_inputs(SAMPLE_LINES)
+    with torch.no_grad():
+        outputs = decode_batch(exported_model, source, source_mask, SOS_ID, EOS_ID, MAX_LEN, REFERENCE_CONFIG)
+    assert outputs == reference(model, source, source_mask)
+
+def test_exported_model_uncached_matches_reference(tmp_path):
+    # use_cache=False goes through greedy_decode, which calls decode on the whole prefix
+    model = small_model(0.7)
+    exported_model = exported(model, tmp_path)
+    cpp_code = '\n'.join(SAMPLE_LINES)
+    assert S.Validate(exported_model, cpp_code, validate=False, use_cache=False) == S.Validate(model, cpp_code, validate=False, use_cache=False)
@@ -0,0 +1,26 @@
+#Job queue bookkeeping: every job that leaves the queue, run or cancelled, shows up in the job metrics
+import threading
+import jobs
+import metrics
+
+def test_cancelled_queued_job_is_recorded():
+    metrics.reset()
+    queue = jobs.JobQueue(workers=1)
+    started, release = threading.Event(), threading.Event()
+    blocker = queue.submit('rule', lambda job: started.set() or (release.wait(10) and {}))
+    assert started.wait(10) # The only worker is busy, the next job has to wait
+    waiting = queue.submit('rule', lambda job: {})
+    assert queue.cancel(waiting.id).status == 'cancelled'
+
+    text = metrics.render()
+    assert 'sastra_jobs_total{kind="rule",status="cancelled"} 1' in text
+    assert 'sastra_job_wait_seconds_count{kind="rule"} 1' in text
+    assert 'sastra_jobs_active{status="queued"} 0' in text
+
+    release.set()
+    blocker.future.result(10)
+    queue.shutdown()
+    text = metrics.render()
+    assert 'sastra_jobs_total{kind="rule",status="done"} 1' in text
+    assert 'sastra_jobs_active{status="queued"} 0' in text
+    assert 'sastra_jobs_active{status="running"} 0' in text
@@ -0,0 +1,51 @@
+#The passthrough gate against the rule it replaced: a line needs the model when one of its surface tokens is
+#a keyword (plain list scan) or the raw line has ++/--
+import pytest
+from SASTRA_Code_Converter_DL import line_gate, cpp_tokenizer, CPP_KEYWORDS
+from benchmark import SAMPLE_LINES, generate_corpus
+
+OLD_KEYWORDS = list(CPP_KEYWORDS)
+
+def old_rule(cpp_line):
+    tokenized_line = cpp_tokenizer.scan(cpp_line)[1]
+    return any(token in OLD_KEYWORDS for token in tokenized_line) or any(op in cpp_line for op in ["++", "--"])
+
+LINES = [
+    'int x = 5;', # in-vocab keywords
+    'return total;',
+    'std::vector<int> values(10, 0);',
+    'auto f = async(run);', # out-of-vocab keywords, scanned as <var>
+    'import foo;',
+    'asyncio = importer + 1;', # only look like them
+    'i++;',
+    '--count;',
+    'name = "a++b";', # ++ inside a string still counts, as before
+    'x = y + z;',
+    'foo(bar);',
+    '',
+    '   ',
+    '}',
+]
+
+def test_out_of_vocab_keywords_are_covered():
+    assert {'async', 'import'} <= line_gate.unknown_keywords
+    assert not {'async', 'import'} & set(cpp_tokenizer.vocab)
+
+@pytest.mark.parametrize('cpp_line', LINES)
+def test_needs_model_matches_old_rule(cpp_line):
+    assert line_gate.needs_model(cpp_line) == old_rule(cpp_line)
+
+def test_classify_matches_old_rule():
+    cpp_lines = LINES + SAMPLE_LINES + generate_corpus(2000, 3).split('\n')
+    gated = line_gate.classify(cpp_lines)
+    assert gated.dtype == bool
+    assert gated.tolist() == [old_rule(cpp_line) for cpp_line in cpp_lines]
+    # The scans translate_lines already has give the same answer
+    assert line_gate.classify(cpp_lines, [cpp_tokenizer.scan(cpp_line) for cpp_line in cpp_lines]).tolist() == gated.tolist()
+
+def test_expected_decisions():
+    assert line_gate.classify(['int x = 5;', 'i++;', 'import foo;', 'x = y + z;', '']).tolist() == [True, True, True, False, False]
+
+def test_empty_file():
+    gated = line_gate.classify([])
+    assert gated.shape == (0,) and gated.dtype == bool
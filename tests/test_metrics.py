@@ -0,0 +1,22 @@
+#The /metrics scrape: every value is published once, under a family name that doesn't collide with another one
+import re
+import app
+import metrics
+
+def test_metrics_families_are_unique():
+    metrics.reset()
+    app.job_queue.submit('rule', lambda job: {}).future.result(10) # Sets the job counters and gauges
+    text = app.app.test_client().get('/metrics').get_data(as_text=True)
+    families = re.findall(r'^# TYPE (\S+) (\S+)$', text, re.M)
+    names = [name for name, _ in families]
+    assert len(names) == len(set(names))
+    # OpenMetrics strips _total from counters, a gauge can't use the name that is left
+    counters = {name[:-len('_total')] for name, kind in families if kind == 'counter'}
+    assert not counters & {name for name, kind in families if kind != 'counter'}
+
+    # Queue depth is sastra_jobs_active, cache hits/misses are sastra_cache_lookups_total
+    for duplicate in ('sastra_jobs_queued', 'sastra_jobs_running', 'sastra_translation_cache_hits',
+                      'sastra_translation_cache_misses', 'sastra_translation_cache_hit_rate'):
+        assert duplicate not in names
+    for gauge in ('sastra_jobs_workers', 'sastra_jobs_max_queued', 'sastra_translation_cache_entries', 'sastra_translation_cache_capacity'):
+        assert dict(families).get(gauge) == 'gauge'
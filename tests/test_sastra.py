@@ -0,0 +1,41 @@
+#Regression checks for the rule-based converter.
+#data/corpus_3000_1.rs is the output of the original (pre-optimisation) sastra.py for benchmark.generate_corpus(3000, 1)
+import contextlib
+import io
+import os
+import sastra
+from benchmark import generate_corpus
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+def read_data(name):
+    with open(os.path.join(DATA, name), 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+def test_generated_corpus_matches_baseline():
+    # The generated classes have one line methods with a nested block, which preprocess_text leaves
+    # with unbalanced braces, so this also covers the '};' / '}' fallback of the class converter
+    with contextlib.redirect_stdout(io.StringIO()):
+        rust_code = sastra.convert_text(sastra.preprocess_text(generate_corpus(3000, 1)))
+    assert rust_code == read_data('corpus_3000_1.rs')
+
+def test_file_pipeline_matches_baseline(tmp_path):
+    cpp_path, pre_path, rust_path = tmp_path / 'in.cpp', tmp_path / 'pre.txt', tmp_path / 'out.rs'
+    cpp_path.write_text(generate_corpus(3000, 1), encoding='utf-8')
+    with contextlib.redirect_stdout(io.StringIO()):
+        sastra.preprocess(str(cpp_path), str(pre_path))
+        sastra.convert(str(pre_path), str(rust_path))
+    with open(rust_path, 'r', newline='') as f:
+        assert f.read() == read_data('corpus_3000_1.rs')
+
+def test_unbalanced_class_falls_back_to_first_terminator():
+    cpp_code = 'class A {\nint x;\nint get(int s) {\n    x = s; if (s > 0) { x += 1;\n}\n};'
+    rust_code = sastra.cpp_to_rust_class_converter(cpp_code)
+    assert rust_code.startswith('pub struct A {')
+    assert 'pub x: i32,' in rust_code
+    assert 'impl A {' in rust_code
+
+def test_nested_method_block_is_kept_whole():
+    cpp_code = 'class A {\nint x;\nint get(int s) { if (s > 0) { x = s; } return x; }\n};'
+    rust_code = sastra.cpp_to_rust_class_converter(cpp_code)
+    assert 'if (s > 0) { self.x = s; } return self.x;' in rust_code
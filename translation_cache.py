@@ -0,0 +1,84 @@
+#This module memoises model translations. C++ lines that only differ in their identifiers, numbers and strings
+#tokenize to the same <var>/<num>/<str> id sequence, so the decoded Rust ids can be reused and re-filled per line.
+import json
+import os
+import threading
+from collections import OrderedDict
+
+class TranslationCache:
+
+    def __init__(self, capacity: int=10000, path=None, tag=None) -> None:
+        self.capacity = capacity
+        self.path = path # Optional JSON file the cache is loaded from and saved to
+        self.tag = tag # Identifies the model the entries came from, entries saved under another tag are ignored
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict() # C++ token ids --> decoded Rust token ids, least recently used first
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        key = tuple(key)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[tuple(key)] = list(value)
+            self._entries.move_to_end(tuple(key))
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def load(self, path=None):
+        path = path or self.path
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Could not load translation cache {path}: {e}")
+            return
+        if data.get('tag') != self.tag:
+            return
+        with self._lock:
+            for key, value in data.get('entries', []):
+                self._entries[tuple(key)] = value
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def save(self, path=None):
+        path = path or self.path
+        if not path:
+            return
+        with self._lock:
+            data = {'tag': self.tag, 'entries': [[list(key), value] for key, value in self._entries.items()]}
+        # Write to a temporary file first so a crash never leaves a half written cache behind
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)